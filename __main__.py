@@ -1,9 +1,11 @@
 import os
 import sys
+import json
 import argparse
 import lib
-from lib import SETTINGS, bold, Repository, ResourceCollection, Subject, \
-                Experiment, Level, log
+from lib import SETTINGS, bold, Repository, ResourceCollection, Experiment, \
+                Level, log
+from lib.analytics.Exporter import EXPORTERS
 
 # Parser creation
 
@@ -11,13 +13,22 @@ parser = argparse.ArgumentParser(
     description="Command line eye tracking utility."
 )
 
-parser.add_argument("-a", "--analyze",      help="performs database analysis",                                                      action="store_true")
+parser.add_argument("-a", "--analyze",      help="performs database analysis of new or changed experiments",                        action="store_true")
 parser.add_argument("-v", "--verbose",      help="increases output verbosity",                                                      action="store_true")
-parser.add_argument("-r", "--refresh",      help="deletes old results and performs full analysis, use when source data changed",    action="store_true")
+parser.add_argument("-r", "--refresh",      help="deletes old results and performs full analysis",                                  action="store_true")
 parser.add_argument("-d", "--delete",       help="deletes specified database, content is lost forever")
 parser.add_argument("-s", "--source",       help="specifies the source database file, the path is relative pyception working directory")
 parser.add_argument("-o", "--destination",  help="specifies analytics output files destination path")
-parser.add_argument("-i", "--info",         help="displays general information",                                                    action="store_true")
+parser.add_argument("-i", "--info",         help="displays general information, see --json",                                        action="store_true")
+parser.add_argument("--json",               help="prints --info output as JSON",                                                    action="store_true")
+parser.add_argument("-j", "--jobs",         help="processes used by --analyze (default 1), or databases scanned by --info",         type=int, default=None)
+parser.add_argument("-f", "--format",       help="specifies analytics output files format: xlsx, csv, parquet, feather or npz",     choices=EXPORTERS)
+parser.add_argument("-b", "--benchmark",    help="checks startup time and heatmap convolution backends",                            action="store_true")
+parser.add_argument("-m", "--migrate",      help="applies pending schema migrations to the source database",                        action="store_true")
+parser.add_argument("-c", "--convert",      help="copies the source database samples into the compact blob layout",                 action="store_true")
+parser.add_argument("-y", "--sync",         help="synchronizes the memory-mapped sample store with the source database",            action="store_true")
+parser.add_argument("-p", "--import",       help="imports a directory of Tobii / OpenSesame recordings into the source database",   dest="import_dir")
+parser.add_argument("--verify",             help="with --sync, also compares up to date samples values",                            action="store_true")
 
 args = parser.parse_args()
 
@@ -38,30 +49,40 @@ if args.source:
 if args.refresh:
     Experiment.refresh = True
 
+if args.format:
+    from lib.analytics.Exporter import exporter
+    lib.SETTINGS["export_format"] = args.format
+    Experiment.exporter = exporter(args.format)
+
 if args.info:
-    print(bold("Working directory : ") + lib.SETTINGS["workdir"])
-    print(bold("Analytics directory : ") + lib.SETTINGS["analytics_dir"])
+    from lib.analytics import info
 
     dbs = ResourceCollection(lib.SETTINGS["workdir"], [".db"])
-    print(bold("\n{0} database(s) found.".format(len(dbs))))
-
-    for db in dbs.list():
-        print("\n{0} ({1})".format(bold(os.path.basename(db)), db))
-        repo = Repository(db)
-        Subject.repository = repo
-        Experiment.repository = repo
-
-        print("  Nb subjects: {0}".format(repo.count("subjects")))
-        print("  Nb experiments : {0}".format(repo.count("experiments")))
-
-        subjects = [Subject(subject["name"]) for subject in
-                    repo.read("subjects")]
-        analysis_completion = 0
-        for subject in subjects:
-            analysis_completion += 1 if subject.saved_analysis else 0
+    databases = info.scan(dbs.list(), args.jobs)
+
+    if args.json:
+        print(json.dumps({
+            'workdir': lib.SETTINGS["workdir"],
+            'analytics_dir': lib.SETTINGS["analytics_dir"],
+            'databases': databases
+        }, indent=2))
+        sys.exit(0)
+
+    print(bold("Working directory : ") + lib.SETTINGS["workdir"])
+    print(bold("Analytics directory : ") + lib.SETTINGS["analytics_dir"])
+    print(bold("\n{0} database(s) found.".format(len(databases))))
+
+    for database in databases:
+        print("\n{0} ({1})".format(bold(database["name"]), database["path"]))
+        if database["error"]:
+            print("  Unreadable database : {0}".format(database["error"]))
+            continue
+        print("  Nb subjects: {0}".format(database["subjects"]))
+        print("  Nb experiments : {0}".format(database["experiments"]))
+        print("  Nb samples : {0}".format(database["samples"]))
         print("  Analysis completion : {0}/{1}".format(
-            analysis_completion,
-            len(subjects)
+            database["analyzed"],
+            database["subjects"]
         ))
     sys.exit(0)
 
@@ -83,15 +104,60 @@ if args.delete:
         log(" Done", Level.DONE)
     sys.exit(0)
 
+if args.benchmark:
+    from lib import benchmark
+    startup = benchmark.import_time()
+    results = benchmark.heatmap_kernels()
+    sys.exit(0 if startup["within_budget"] and
+             all(result["equivalent"] for kernel in results.values()
+                 for result in kernel.values()) else 1)
+
+if args.migrate:
+    version = Repository(lib.SETTINGS["db_file"]).migrate()
+    log("Database %s is at version %d." % (lib.SETTINGS["db_file"], version))
+    sys.exit(0)
+
+if args.convert:
+    repo = Repository(lib.SETTINGS["db_file"], profile="bulk_import")
+    repo.migrate()
+    log("Converting %s samples..." % lib.SETTINGS["db_file"],
+        Level.INFORMATION)
+    log("%d samples converted." % repo.convert_samples(), Level.INFORMATION)
+    sys.exit(0)
+
+if args.sync:
+    repo = Repository(lib.SETTINGS["db_file"])
+    repo.migrate()
+    log("Synchronizing %s sample store..." % lib.SETTINGS["db_file"],
+        Level.INFORMATION)
+    result = Experiment.sync_samples(repo, args.verify)
+    log("{0} experiment(s) written, {1} removed, {2} mismatched.".format(
+        len(result["written"]), len(result["removed"]),
+        len(result["mismatched"])
+    ), Level.INFORMATION)
+    sys.exit(1 if result["mismatched"] else 0)
+
+if args.import_dir:
+    from lib import importer
+    repo = Repository(lib.SETTINGS["db_file"], profile="bulk_import")
+    repo.initialize()
+    results = importer.import_directory(repo, args.import_dir)
+    log("{0} subject(s), {1} experiment(s) and {2} samples imported, {3} "
+        "samples skipped.".format(
+            len(results), sum(result["experiments"] for result in results),
+            sum(result["samples"] for result in results),
+            sum(result["skipped"] for result in results)
+        ), Level.INFORMATION)
+    sys.exit(0)
+
 if args.analyze:
+    from lib.analytics import tasks
     repo = Repository(lib.SETTINGS["db_file"])
-    Subject.repository = repo
-    Experiment.repository = repo
-    subjects = [Subject(subject["name"]) for subject in repo.read("subjects")]
+    repo.migrate()
+    names = [subject["name"] for subject in repo.read("subjects")]
 
-    for subject in subjects:
-        subject.analyze()
-        subject.save()
-    sys.exit(0)
+    results = tasks.analyze(lib.SETTINGS["db_file"], names, args.jobs or 1)
+    sys.exit(0 if not any(result["error"] or result["failures"]
+                          for result in results) else 1)
 
 parser.print_help()
@@ -12,6 +12,7 @@ Part of the **PyCeption** package.
 """
 
 import os
+import threading
 from enum import Enum
 from time import gmtime, strftime
 import lib
@@ -81,15 +82,22 @@ class Logger(object):
 
 # ----------------------------------------------------------------------- MAGIC
 
-    def __init__(self, output_level: Level = Level.INFORMATION):
+    def __init__(self, output_level: Level = Level.INFORMATION,
+                 buffered: bool = False):
         """
         Class constructor. Initializes the logging output level an detect
         whether the script is running on a windows or unix platform.
 
         :param output_level:    The stdout verbosity of the logging.
+        :param buffered:        Whether to hold stdout output until **flush**
+                                instead of printing it, e.g in worker
+                                processes whose output must not interleave.
         :type output_level:     Level
+        :type buffered:         bool
         """
         self.output_level = output_level
+        self.buffered = buffered
+        self.buffer = list()
         self._print = self._print_nt if os.name == 'nt' else self._print_unix
 
         fout_path = os.path.join(
@@ -97,7 +105,8 @@ class Logger(object):
             strftime("%y-%m-%d.log", gmtime())
         )
         self._file_out = open(fout_path, "a+")
-        self._last_output_level = None
+        self._lock = threading.Lock()
+        self._line = threading.local()
 
 # --------------------------------------------------------------------- METHODS
 
@@ -106,21 +115,57 @@ class Logger(object):
         """
         Main class method, logs the messages.
 
+        Lines are written whole, whatever the calling thread: a message
+        without line separator, e.g "Saving..." before " Done", is held until
+        the same thread completes it, so that messages logged meanwhile by
+        other threads do not break it.
+
         :param message:     The text to be logged.
         :param lvl:         The level of the message.
         :type message:      str
         :type lvl:          Level
         """
         output = self._print(message, lvl)
+        pending = getattr(self._line, "text", None)
 
         if lvl == Level.DONE or lvl == lvl.FAILED:
-            lvl = self._last_output_level
-
-        if lvl.value <= self.output_level.value:
-            print(output, end=linesep)
-        self._file_out.write(output + linesep)
+            lvl = getattr(self._line, "level", lvl)
+            output = (pending or "") + output
+        elif pending is not None:
+            # Not completed before the next message: written on its own
+            self._write(pending + os.linesep, self._line.level)
+
+        self._line.level = lvl
+        if linesep.endswith("\n"):
+            self._line.text = None
+            self._write(output + linesep, lvl)
+        else:
+            self._line.text = output + linesep
+
+    def _write(self, line: str, lvl: Level) -> None:
+        """
+        Writes a complete **line** to the log file, and to stdout or its
+        buffer if **lvl** is within the output level.
+        """
+        with self._lock:
+            if lvl.value <= self.output_level.value:
+                if self.buffered:
+                    self.buffer.append(line)
+                else:
+                    print(line, end="")
+            self._file_out.write(line)
+
+    def flush(self) -> str:
+        """
+        Empties the stdout buffer of a buffered logger.
 
-        self._last_output_level = lvl
+        :return:    The buffered output, ready to be printed.
+        :rtype:     str
+        """
+        with self._lock:
+            output = "".join(self.buffer)
+            self.buffer = list()
+        return output
 
     def _print_nt(self, text: str, lvl: Level = Level.INFORMATION,
                   linesep: str = os.linesep):
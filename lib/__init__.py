@@ -17,9 +17,10 @@ from .Logger import Logger, Level, Color, Background, bold
 logger = Logger(SETTINGS["logging_level"])
 log = logger.log
 
+from .utils import inheritdoc, lazy_attribute
 from .model import path, Repository, ResourceCollection
-from .utils import inheritdoc
-from .analytics import Point, Area, FixationDetector, IVT, Subject, Experiment
+from .analytics import Point, Area, GazeFrame, FixationDetector, IVT, \
+                       Subject, Experiment
 
 
 def reload() -> None:
@@ -12,17 +12,23 @@ Part of the **Pyception** package.
 """
 
 import os
+import json
+import hashlib
+from collections import OrderedDict
 
 import numpy as np
-import pandas as pd
-import matplotlib
-import matplotlib.pyplot as plt
-from scipy.ndimage.filters import convolve
 
 import lib as pct
-from lib import Level
+from lib import Level, lazy_attribute
 
 from .IVT import IVT
+from .GazeFrame import GazeFrame
+from .SampleStore import SampleStore
+from .convolution import convolve
+from .Heatmap import Heatmap
+from .ResultCache import ResultCache
+from .Exporter import EXPORTERS, exporter as make_exporter
+from . import render
 from .plan2d import matrix, circle_matrix, Point, Area
 
 
@@ -49,32 +55,65 @@ class Experiment(object):
     """
 # ------------------------------------------------------------------- VARIABLES
 
-    repository = pct.Repository(pct.SETTINGS["db_file"])
     algorithm = IVT()
-    convolution_kernel = circle_matrix(80, True)
-    filename = "results.xlsx"
+    data_columns = ("id", "timestamp", "x", "y")
+    sample_storage = pct.SETTINGS.get("sample_storage", "rows")
+    sample_store = pct.SETTINGS.get("sample_store", False)
+    convolution_backend = pct.SETTINGS.get("heatmap_backend", "fft")
+    filename = "results"
+    exporter = make_exporter(pct.SETTINGS.get("export_format", "xlsx"))
+    fingerprint_filename = "fingerprint.json"
+    # The data summary entries computed without checksums
+    quick_summary = ("count", "min_id", "max_id", "chunks")
+    cache = ResultCache(
+        os.path.join(pct.SETTINGS["workdir"], "cache"),
+        pct.SETTINGS.get("result_cache_size", 2 * 1024 ** 3)
+    ) if pct.SETTINGS.get("result_cache", True) else None
     refresh = False
     heatmap_figure_max_value = 1.0
 
+    @lazy_attribute
+    def repository(cls):
+        return pct.Repository.shared(pct.SETTINGS["db_file"])
+
+    @lazy_attribute
+    def convolution_kernel(cls):
+        return circle_matrix(80, True)
+
 # ----------------------------------------------------------------------- MAGIC
 
-    def __init__(self, name: str, subject) -> None:
+    def __init__(self, name: str, subject, description: dict = None,
+                 aois: list = None, data_summary: dict = None) -> None:
         """
-        Intializes variables to their default values.
-
-        :param name:    The name of the experiment.
-        :param subject: The Subject who owns this experiment.
-        :type name:     str
-        :type subject:  Subject
+        Intializes variables to their default values. The description, areas
+        of interest and data summary are pulled from the repository unless
+        given, e.g batch loaded by **Subject.pull**. Raw data are only loaded
+        on first access to **data**.
+
+        :param name:            The name of the experiment.
+        :param subject:         The Subject who owns this experiment.
+        :param description:     The experiments table record.
+        :param aois:            The experiment areas of interest.
+        :param data_summary:    The data rows summary, see **data_summary**.
+        :type name:             str
+        :type subject:          Subject
+        :type description:      dict
+        :type aois:             list
+        :type data_summary:     dict
         """
         self.name = name
         self.directory = os.path.join(subject.directory, name)
         self.subject = subject
+        self.repository = subject.repository
         self.id = None
         self.aois = list()
+        self._data = None
 
         self.persistent = False
-        self._load()
+        self._data_summary = data_summary
+        self._fingerprint = None
+        self._fingerprint_sources = None
+        self._load(description, aois)
 
         self.length = None
         self.mean_frequency = None
@@ -87,55 +126,152 @@ class Experiment(object):
 
 # --------------------------------------------------------------------- METHODS
 
-    def _load(self) -> None:
+    def _load(self, description: dict = None, aois: list = None) -> None:
         """
         Deferred class constructor, loads variables values from the underlying
         repository.
 
+        :param description: The experiments table record, pulled if omitted.
+        :param aois:        The areas of interest, pulled if omitted.
+        :type description:  dict
+        :type aois:         list
+
         .. seealso:: Repository
         """
-        pct.log("Retreiving experiment %s description..." % self.name,
-                Level.DEBUG, linesep="")
-        repo_self = self.repository.read({
-            'name': self.name,
-            'subject': self.subject.id
-        }, "experiments")
-
-        if not repo_self:
-            pct.log(" Failed", Level.FAILED)
-            pct.log("Experiment %s for %s does not exist in database." %
-                    (self.name, self.subject.name), Level.WARNING)
-            return
-
-        repo_self = repo_self[0]
-        pct.log(" Done", Level.DONE)
+        if description is None:
+            pct.log("Retreiving experiment %s description..." % self.name,
+                    Level.DEBUG, linesep="")
+            repo_self = self.repository.read({
+                'name': self.name,
+                'subject': self.subject.id
+            }, "experiments")
+
+            if not repo_self:
+                pct.log(" Failed", Level.FAILED)
+                pct.log("Experiment %s for %s does not exist in database." %
+                        (self.name, self.subject.name), Level.WARNING)
+                return
+
+            description = repo_self[0]
+            pct.log(" Done", Level.DONE)
 
-        self.id = repo_self['id']
-        self.data = self.repository.read({'experiment': self.id}, "data")
+        self.id = description['id']
         self.persistent = True
 
-        aois = self.repository.read({
-            'experiment': self.id
-        }, "experiments", "aois")
+        if aois is None:
+            aois = [self.area(aoi_def) for aoi_def in self.repository.read({
+                'id': self.id
+            }, "experiments", "aois")]
+        self.aois = list(aois)
 
-        for aoi_def in aois:
-            self.aois.append(Area(
-                Point(aoi_def["top_left_x"], aoi_def["top_left_y"]),
-                Point(aoi_def["bottom_right_x"], aoi_def["bottom_right_y"])
-            ))
+    def load_data(self) -> GazeFrame:
+        """
+        Loads the experiment raw data, once.
 
-    def _frequence_over_time(self, data: list):
+        :return:    The experiment samples, ordered by timestamp.
+        :rtype:     GazeFrame
+        """
+        if self._data is None:
+            if not self.persistent:
+                self._data = GazeFrame.empty()
+            elif self.sample_store:
+                store = SampleStore.shared(pct.SETTINGS["workdir"],
+                                           self.repository.db_file)
+                if self._data_summary is None:
+                    self._data_summary = self.data_summary(self.repository,
+                                                           self.id)
+                digest = self.digest(self._data_summary)
+                columns = store.load(self.id, digest)
+                if columns is None:
+                    columns = self.read_samples(self.repository, self.id)
+                    store.store(self.id, columns, digest)
+                    columns = store.load(self.id, digest)
+                self._data = GazeFrame.from_columns(columns)
+            else:
+                self._data = GazeFrame.from_columns(
+                    self.read_samples(self.repository, self.id,
+                                      self.data_columns)
+                )
+        return self._data
+
+    @classmethod
+    def read_samples(cls, repository, experiment: int,
+                     columns: tuple = SampleStore.columns) -> OrderedDict:
+        """
+        Reads an experiment samples from the database, in the
+        **sample_storage** layout.
+
+        :param repository:  The queried repository.
+        :param experiment:  The experiment id.
+        :param columns:     The data table columns to read, the blob layout
+                            only storing timestamp, x and y.
+        :type repository:   Repository
+        :type experiment:   int
+        :type columns:      tuple
+        :return:            The column / array dictionnary, in timestamp
+                            order.
+        :rtype:             OrderedDict
+        """
+        pct.log("Retreiving experiment %s data..." % experiment,
+                Level.DEBUG, linesep="")
+        if cls.sample_storage == "blob":
+            retval = repository.read_samples(experiment)
+        else:
+            retval = repository.read_columns(
+                {'experiment': experiment}, "data", columns,
+                GazeFrame.dtypes, "timestamp"
+            )
+        pct.log(" Done", Level.DONE)
+        return retval
+
+    @classmethod
+    def sync_samples(cls, repository, verify: bool = False) -> dict:
+        """
+        Synchronizes the **repository** sidecar sample store with its data,
+        see **SampleStore.sync**.
+
+        :param repository:  The synchronized repository.
+        :param verify:      Whether to compare up to date experiments
+                            contents too.
+        :type repository:   Repository
+        :type verify:       bool
+        :return:            The written, removed and mismatched experiments.
+        :rtype:             dict
+        """
+        digests = dict()
+        for summary in cls.data_summary(repository):
+            experiment = summary.pop("experiment")
+            digests[experiment] = cls.digest(summary)
+        store = SampleStore.shared(pct.SETTINGS["workdir"],
+                                   repository.db_file)
+        return store.sync(
+            digests, lambda experiment: cls.read_samples(repository,
+                                                         experiment),
+            verify
+        )
+
+    @staticmethod
+    def area(aoi_def: dict) -> Area:
+        """
+        Builds an Area from an aois table record.
+        """
+        return Area(
+            Point(aoi_def["top_left_x"], aoi_def["top_left_y"]),
+            Point(aoi_def["bottom_right_x"], aoi_def["bottom_right_y"])
+        )
+
+    def _frequence_over_time(self, data: GazeFrame):
         """
         Computes the frequence for each sample of the given dataset.
-        Computed frequences are saved in the given list.
+        Computed frequences are saved in the given frame **frequence** column,
+        the first sample frequence being undefined (NaN).
 
-        :param data: List of timed coordinates.
+        :param data: Frame of timed coordinates.
         """
-        for i, cell in enumerate(data):
-            if i == 0:
-                continue
-            delta = cell["timestamp"] - data[i-1]["timestamp"]
-            data[i]["frequence"] = 1.0 / abs(delta)
+        frequence = np.full(len(data), np.nan)
+        with np.errstate(divide="ignore"):
+            frequence[1:] = 1.0 / np.abs(np.diff(data.timestamp))
+        data["frequence"] = frequence
 
     def analyze(self) -> None:
         """
@@ -151,6 +287,9 @@ class Experiment(object):
         - the fixation matrix ;
         - the fixation / area of interest link, that is to say which fixations
         lay in which area and for how long.
+
+        Results are loaded from **cache** instead when they were previously
+        computed from the same data, areas of interest and parameters.
         """
         pct.log("Analyzing experiment %s..." % self.id)
         if not self.persistent:
@@ -161,10 +300,13 @@ class Experiment(object):
             pct.log("Inconsistent data...", Level.DEBUG, linesep="")
             pct.log(" Skipped", Level.FAILED)
             return
+        if self._restore():
+            self.analyzed = True
+            return
 
         pct.log("Computing general values...", Level.DEBUG, linesep="")
-        self.length = abs(self.data[-1]["timestamp"]
-                          - self.data[0]["timestamp"])
+        self.length = abs(float(self.data.timestamp[-1])
+                          - float(self.data.timestamp[0]))
         self.mean_frequency = float(len(self.data)) / self.length
         self._frequence_over_time(self.data)
         pct.log(" Done", Level.DONE)
@@ -194,6 +336,87 @@ class Experiment(object):
 
         self.analyzed = True
         pct.log(" Done", Level.DONE)
+        self._archive()
+
+    def _cache_key(self, *extra) -> str:
+        """
+        The **cache** entry key of this experiment results, **extra** parts
+        identifying derived results (e.g the heatmap backend).
+        """
+        return ResultCache.key(
+            os.path.abspath(self.repository.db_file), self.id,
+            self.fingerprint, *extra
+        )
+
+    def _archive(self) -> None:
+        """
+        Stores this experiment analysis results in **cache**.
+        """
+        if self.cache is None:
+            return
+        points = self.fixation_points
+        self.cache.store(self._cache_key(), {
+            'general': np.array([self.length, self.mean_frequency]),
+            'fixations_x': np.array([point["x"] for point in points]),
+            'fixations_y': np.array([point["y"] for point in points]),
+            'fixations_time': np.array([point["time"] for point in points]),
+            'aois': np.array(
+                [aoi["aoi"] for aoi in self.aois_fixations], dtype=np.str_
+            ),
+            'aois_count': np.array(
+                [aoi["count"] for aoi in self.aois_fixations], dtype=np.int64
+            ),
+            'aois_time': np.array(
+                [aoi["time"] for aoi in self.aois_fixations]
+            ),
+            'frequence': self.data.frequence,
+            'speed': self.data.speed,
+            'fixation': self.data.fixation
+        })
+
+    def _restore(self) -> bool:
+        """
+        Loads this experiment analysis results from **cache**.
+
+        :return:    Whether the results were found or not.
+        :rtype:     bool
+        """
+        if self.cache is None:
+            return False
+        arrays = self.cache.load(self._cache_key())
+        if arrays is None or "aois" not in arrays \
+                or len(arrays["speed"]) != len(self.data):
+            return False
+        # AOI order depends on how they were pulled, results are matched
+        # by AOI rather than by position
+        aois = dict(zip(arrays["aois"].tolist(), zip(
+            arrays["aois_count"].tolist(), arrays["aois_time"].tolist()
+        )))
+        if any(str(aoi) not in aois for aoi in self.aois):
+            return False
+
+        pct.log("Loading cached analysis...", Level.DEBUG, linesep="")
+        self.length, self.mean_frequency = arrays["general"].tolist()
+        for column in ("frequence", "speed", "fixation"):
+            self.data[column] = arrays[column]
+        self.fixation_points = [
+            {'x': x, 'y': y, 'time': time} for x, y, time in zip(
+                arrays["fixations_x"].tolist(),
+                arrays["fixations_y"].tolist(),
+                arrays["fixations_time"].tolist()
+            )
+        ]
+        self.fixation_matrix = matrix(self.fixation_points)
+        self.aois_fixations = [
+            {
+                'aoi': str(aoi),
+                'count': aois[str(aoi)][0],
+                'time': aois[str(aoi)][1],
+                'weight': aois[str(aoi)][1] / self.length * 100
+            } for aoi in self.aois
+        ]
+        pct.log(" Done", Level.DONE)
+        return True
 
     def make_heatmap(self) -> np.ndarray:
         """
@@ -201,13 +424,18 @@ class Experiment(object):
         Helpful for visualisation.
 
         This method must be called after analyze.
-        This method is **computationally expensive** and may take a while to
-        complete.
+        The convolution is operated by **convolution_backend**, see the
+        convolution module, or through kernel splatting when set to "splat"
+        (see Heatmap). The direct backend is **computationally expensive** and
+        may take a while to complete.
+
+        Heatmaps are stored in **cache** as float32 matrices, later calls
+        with the same data and parameters memory-map them instead.
 
         :return:    The computed heatmap matrix.
         :rtype:     np.ndarray
         """
-        if self.heatmap:
+        if self.heatmap is not None:
             return self.heatmap
         if not self.analyzed:
             error_msg = "A call to analyze must be done prior to the heatmap" \
@@ -215,36 +443,78 @@ class Experiment(object):
             pct.log(error_msg, Level.EXCEPTION)
             raise Exception(error_msg)
 
-        pct.log("Computing matrix convolution...", Level.DEBUG, linesep="")
-        self.heatmap = convolve(
-            self.fixation_matrix,
-            self.convolution_kernel
-        )
+        cache_key = self._cache_key("heatmap", self.convolution_backend) \
+            if self.cache is not None else None
+        if cache_key is not None:
+            self.heatmap = self.cache.load_matrix(cache_key)
+            if self.heatmap is not None:
+                pct.log("Heatmap loaded from cache.", Level.DEBUG)
+                return self.heatmap
+
+        pct.log("Computing matrix convolution ({0})...".format(
+            self.convolution_backend
+        ), Level.DEBUG, linesep="")
+        if self.convolution_backend == "splat":
+            max_y, max_x = self.fixation_matrix.shape
+            self.heatmap = Heatmap(
+                self.convolution_kernel, max_x, max_y
+            ).extend(self.fixation_points).matrix
+        else:
+            self.heatmap = convolve(
+                self.fixation_matrix,
+                self.convolution_kernel,
+                self.convolution_backend
+            )
+        if cache_key is not None:
+            self.cache.store_matrix(cache_key, self.heatmap)
 
         pct.log(" Done", Level.DONE)
         return self.heatmap
 
-    def figure(self, cmap: str = 'nipy_spectral') -> matplotlib.figure.Figure \
-            and matplotlib.image and plt.colorbar:
+    def figure(self, cmap: str = 'nipy_spectral') -> tuple:
         """
-        Builds a pyplot Figure object with the previously computed heatmap in
-        it. The resulting image is different from the original heatmap as
-        values above **heatmap_figure_max_value** are grouped together.
+        Draws the previously computed heatmap on the calling thread reusable
+        Agg Figure (see render.figure). The resulting image is different from
+        the original heatmap as values above **heatmap_figure_max_value** are
+        grouped together.
+
+        The figure is redrawn by the next call from the same thread, save it
+        before.
 
         :param cmap:    The figure image color code.
         :type cmap:     str
-        :return:        The composite elements of the newly created figure.
-        :rtype:         plt.figure.Figure and plt.Image and plt.colorbar
+        :return:        The composite elements of the figure.
+        :rtype:         Figure and AxesImage and Colorbar
         """
         if self.heatmap is None:
             pct.log("Heatmap not built yet, unable to create figure.",
                     Level.ERROR)
             return
-        fig = plt.figure()
-        image = plt.imshow(self.heatmap, cmap=cmap, vmin=0.0,
-                           vmax=self.heatmap_figure_max_value)
-        clrb = plt.colorbar()
-        return fig, image, clrb
+        return render.figure(self.heatmap, cmap, 0.0,
+                             self.heatmap_figure_max_value)
+
+    def save_heatmap(self, directory: str = None,
+                     cmap: str = 'nipy_spectral') -> None:
+        """
+        Writes the previously computed heatmap as a raw image (heatmap.png)
+        and as an annotated figure (heatmap_figure.png).
+
+        :param directory:   The destination directory, default to this
+                            experiment directory.
+        :param cmap:        The images color code.
+        :type directory:    str
+        :type cmap:         str
+        """
+        if self.heatmap is None:
+            pct.log("Heatmap not built yet, unable to save it.", Level.ERROR)
+            return
+        directory = self.directory if directory is None else directory
+        os.makedirs(directory, exist_ok=True)
+
+        render.imsave(os.path.join(directory, "heatmap.png"), self.heatmap,
+                      cmap)
+        fig, image, colorbar = self.figure(cmap)
+        fig.savefig(os.path.join(directory, "heatmap_figure.png"))
 
     def save(self, destination: str = None, refresh: bool = None) -> None:
         """
@@ -259,43 +529,242 @@ class Experiment(object):
                             experiment save or not.
         :type refresh:      bool
         """
+        directory = self.directory if destination is None else destination
+        refresh = self.refresh if refresh is None else refresh
+
+        if self.is_saved(directory) and not refresh:
+            pct.log("Experiment analytics up to date, skipping.", linesep="")
+            pct.log(" Done", Level.DONE)
+            return
         if not self.analyzed:
             pct.log("Experiment must be analyzed prior to save.", Level.ERROR)
             return
 
-        directory = self.directory if destination is None else destination
-        refresh = self.refresh if refresh is None else refresh
-
         if not os.path.isdir(directory):
             os.makedirs(directory)
-        for cell in self.data:  # TODO check how to alleviate this
-            cell["fixation"] = str(cell["fixation"])
-        filepath = os.path.join(directory, self.filename)
-        if os.path.isfile(filepath) and not refresh:
-            pct.log("Experiment analytics already done, skipping.", linesep="")
-            pct.log(" Done", Level.DONE)
-            return
         pct.log("Starting experiment save...", linesep="")
 
-        gen_data = pd.DataFrame(list({
-            'id': self.id,
-            'name': self.name,
-            'subject': self.subject.name,
-            'length': self.length,
-            'mean_frequency': self.mean_frequency
-        }.items()))
-
-        writer = pd.ExcelWriter(os.path.join(directory, self.filename))
-        gen_data.to_excel(writer, "general")
-        pd.DataFrame(self.data).to_excel(writer, "data")
-        pd.DataFrame(self.fixation_points).to_excel(writer, "fixations")
-        pd.DataFrame(self.aois_fixations).to_excel(writer, "aois")
-
-        writer.save()
+        self.exporter.export(directory, self.filename, self.sheets())
+
+        # Written last, an interrupted save is thus never deemed up to date
+        with open(os.path.join(directory, self.fingerprint_filename), "w") \
+                as fingerprint_file:
+            json.dump({
+                'fingerprint': self.fingerprint,
+                'sources': self._fingerprint_sources
+            }, fingerprint_file, indent=4, sort_keys=True)
         pct.log(" Done", Level.DONE)
 
+    def sheets(self) -> OrderedDict:
+        """
+        This experiment analysis results, as exported by **exporter**.
+
+        :return:    The name / table ordered dictionnary.
+        :rtype:     OrderedDict
+        """
+        return OrderedDict([
+            ('general', OrderedDict([
+                ('id', self.id),
+                ('name', self.name),
+                ('subject', self.subject.name),
+                ('length', self.length),
+                ('mean_frequency', self.mean_frequency)
+            ])),
+            ('data', self.data),
+            ('fixations', self.fixation_points),
+            ('aois', self.aois_fixations)
+        ])
+
+    def fingerprint_sources(self, data_summary: dict = None) -> dict:
+        """
+        Gathers everything an analysis result depends on:
+
+        - the data rows summary (count, id range and value checksums) ;
+        - the areas of interest ;
+        - the algorithms parameters.
+
+        :param data_summary:    The data rows summary, as computed by
+                                **data_summary**, queried when omitted.
+        :type data_summary:     dict
+        :return:                The fingerprint sources.
+        :rtype:                 dict
+        """
+        if data_summary is None:
+            data_summary = self._data_summary
+        if data_summary is None:
+            data_summary = self.data_summary(self.repository, self.id)
+        return {
+            'data': data_summary,
+            'aois': sorted(str(aoi) for aoi in self.aois),
+            'parameters': self.parameters()
+        }
+
+    @classmethod
+    def data_summary(cls, repository, experiment: int or list = None,
+                     checksums: bool = True) -> dict or list:
+        """
+        Summarizes the data rows of an experiment through SQL aggregates only,
+        without loading them. When **experiment** is a list of ids, or
+        omitted, those experiments, or every experiment, are summarized in a
+        single query.
+
+        Value checksums evaluate an expression over every data row: without
+        **checksums**, the summary is limited to the rows count and id range
+        (samples count and chunks with the blob storage).
+
+        :param repository:  The queried repository.
+        :param experiment:  The experiment id, or ids.
+        :param checksums:   Whether to compute the value checksums.
+        :type repository:   Repository
+        :type experiment:   int or list
+        :type checksums:    bool
+        :return:            The summary, or a list of summaries including the
+                            experiment id. Experiments without data are
+                            missing from the list.
+        :rtype:             dict or list
+
+        With the blob **sample_storage**, the summary is made of the samples
+        chunks counts and stored checksums.
+        """
+        table = "data"
+        expressions = {
+            'count': "COUNT(*)",
+            'min_id': "MIN(id)",
+            'max_id': "MAX(id)",
+            'timestamp_total': "TOTAL(timestamp)",
+            'x_total': "TOTAL(x)",
+            'y_total': "TOTAL(y)",
+            'checksum': "TOTAL(id * (timestamp + x * y))"
+        }
+        if cls.sample_storage == "blob":
+            table = "samples"
+            expressions = {
+                'count': "CAST(TOTAL(count) AS INTEGER)",
+                'chunks': "COUNT(*)",
+                'dtype': "MAX(dtype)",
+                'checksum': "TOTAL(checksum * (chunk + 1))"
+            }
+        if not checksums:
+            expressions = {name: expression
+                           for name, expression in expressions.items()
+                           if name in cls.quick_summary}
+        if experiment is None:
+            return repository.aggregate(expressions, {}, table, "experiment")
+        if isinstance(experiment, list):
+            return repository.aggregate(
+                expressions, {'experiment': experiment}, table, "experiment"
+            )
+        return repository.aggregate(
+            expressions, {'experiment': experiment}, table
+        )[0]
+
+    @classmethod
+    def parameters(cls) -> dict:
+        """
+        The algorithms parameters analysis results depend on.
+        """
+        return {
+            'algorithm': cls.algorithm.__class__.__name__,
+            'threshold': getattr(cls.algorithm, "threshold", None),
+            'kernel_radius': cls.convolution_kernel.shape[0] // 2
+        }
+
+    @staticmethod
+    def digest(sources: dict) -> str:
+        """
+        Hashes fingerprint sources into a fingerprint.
+        """
+        return hashlib.sha1(
+            json.dumps(sources, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def stored_fingerprint(self, directory: str = None) -> str:
+        """
+        Reads the fingerprint saved along the analysis results.
+
+        :param directory:   The results directory, default to this experiment
+                            directory.
+        :type directory:    str
+        :return:            The stored fingerprint or None.
+        :rtype:             str
+        """
+        return self._stored(directory).get("fingerprint")
+
+    def _stored(self, directory: str = None) -> dict:
+        """
+        Reads the fingerprint file saved along the analysis results, empty
+        if missing or unreadable.
+        """
+        directory = self.directory if directory is None else directory
+        try:
+            with open(os.path.join(directory, self.fingerprint_filename)) \
+                    as fingerprint_file:
+                stored = json.load(fingerprint_file)
+        except (IOError, ValueError):
+            return dict()
+        return stored if isinstance(stored, dict) else dict()
+
+    def is_saved(self, directory: str = None, any_format: bool = False,
+                 summary: dict = None) -> bool:
+        """
+        Whether the results saved in **directory** exist and were computed
+        from the current data, areas of interest and parameters.
+
+        Given a **summary** computed without checksums, the saved fingerprint
+        sources are compared to it instead of computing the fingerprint: a
+        quick check, blind to data values updated in place, for overviews.
+
+        :param directory:   The export directory, default to this experiment
+                            one.
+        :param any_format:  Whether results exported in any format count, or
+                            only those of **exporter**.
+        :param summary:     The data summary without checksums, see
+                            **data_summary**.
+        :type directory:    str
+        :type any_format:   bool
+        :type summary:      dict
+        :return:            Whether the saved results are up to date.
+        :rtype:             bool
+        """
+        directory = self.directory if directory is None else directory
+        exporters = [exporter() for exporter in EXPORTERS.values()] \
+            if any_format else [self.exporter]
+        if not any(os.path.isfile(exporter.path(directory, self.filename))
+                   for exporter in exporters):
+            return False
+        if not self.persistent:
+            return False
+        if summary is None:
+            return self.stored_fingerprint(directory) == self.fingerprint
+
+        stored = self._stored(directory)
+        sources = stored.get("sources")
+        if not isinstance(sources, dict) \
+                or stored.get("fingerprint") != self.digest(sources):
+            return False
+        data = sources.get("data") or dict()
+        return all(data.get(name) == value
+                   for name, value in summary.items()) \
+            and sources.get("aois") == sorted(str(aoi) for aoi in self.aois) \
+            and sources.get("parameters") == self.parameters()
+
 # ------------------------------------------------------------------ PROPERTIES
 
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint_sources = self.fingerprint_sources()
+            self._fingerprint = self.digest(self._fingerprint_sources)
+        return self._fingerprint
+
+    @property
+    def data(self) -> GazeFrame:
+        return self.load_data()
+
+    @data.setter
+    def data(self, data: GazeFrame) -> None:
+        self._data = data
+
     @property
     def saved_analysis(self):
-        return os.path.isfile(os.path.join(self.directory, self.filename))
+        return self.is_saved()
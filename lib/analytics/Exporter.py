@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import os
+import csv
+from abc import ABCMeta
+from collections import OrderedDict
+
+import numpy as np
+
+from .GazeFrame import GazeFrame
+
+
+class Exporter(metaclass=ABCMeta):
+    """
+    Abstract class intented to be inherited by any class which purpose would be
+    to write an experiment analysis results to disk.
+
+    Results are a set of named sheets (general, data, fixations, aois), each
+    sheet being a table: a GazeFrame, a list of dictionnaries sharing the
+    same keys or a single dictionnary (one row table). Every format maps
+    sheets and columns the same way.
+
+    The general sheet is always written last: **path** points to it, so that
+    its existence means the export completed.
+    """
+
+    extension = None
+
+    def path(self, directory: str, basename: str) -> str:
+        """
+        The path of the file whose existence means the export completed.
+
+        :param directory:   The export directory.
+        :param basename:    The results files base name, without extension.
+        :type directory:    str
+        :type basename:     str
+        :return:            The file path.
+        :rtype:             str
+        """
+        return os.path.join(directory, "{0}.general.{1}".format(
+            basename, self.extension
+        ))
+
+    def export(self, directory: str, basename: str, sheets: dict) -> None:
+        """
+        Writes the **sheets** sheets in **directory**.
+
+        :param directory:   The export directory.
+        :param basename:    The results files base name, without extension.
+        :param sheets:      The name / table ordered dictionnary.
+        :type directory:    str
+        :type basename:     str
+        :type sheets:       OrderedDict
+        """
+        raise NotImplementedError("Call to abstract class.")
+
+    @staticmethod
+    def columns(table: GazeFrame or list or dict) -> OrderedDict:
+        """
+        Translates a table into a name / values ordered dictionnary.
+
+        :param table:   A GazeFrame, list of dictionnaries or dictionnary.
+        :return:        The table columns.
+        :rtype:         OrderedDict
+        """
+        if isinstance(table, GazeFrame):
+            return OrderedDict((name, table[name]) for name in table.columns)
+        if isinstance(table, dict):
+            table = [table]
+        retval = OrderedDict()
+        if table:
+            for name in table[0].keys():
+                retval[name] = [row[name] for row in table]
+        return retval
+
+    @staticmethod
+    def dataframe(table: GazeFrame or list or dict):
+        """
+        Translates a table into a pandas DataFrame.
+        """
+        import pandas as pd
+        if isinstance(table, GazeFrame):
+            return table.to_dataframe()
+        return pd.DataFrame(Exporter.columns(table))
+
+    @staticmethod
+    def _ordered(sheets: dict) -> list:
+        """
+        Sheets in writing order, general last.
+        """
+        return sorted(sheets.items(), key=lambda item: item[0] == "general")
+
+
+class ExcelExporter(Exporter):
+    """
+    Writes every sheet in a single Excel workbook. Tables longer than an
+    Excel sheet are split over several numbered sheets.
+
+    One row tables (e.g general) keep the historic workbook layout: one
+    key / value row per column.
+    """
+
+    extension = "xlsx"
+    max_rows = 1048575
+
+    def path(self, directory: str, basename: str) -> str:
+        return os.path.join(directory, "{0}.{1}".format(
+            basename, self.extension
+        ))
+
+    def export(self, directory: str, basename: str, sheets: dict) -> None:
+        import pandas as pd
+        writer = pd.ExcelWriter(self.path(directory, basename))
+        for name, table in sheets.items():
+            dataframe = pd.DataFrame(list(table.items())) \
+                if isinstance(table, dict) else self.dataframe(table)
+            for index, start in enumerate(
+                    range(0, max(len(dataframe), 1), self.max_rows)):
+                sheet = name if index == 0 else "{0} ({1})".format(
+                    name, index + 1
+                )
+                dataframe[start:start + self.max_rows].to_excel(
+                    writer, sheet_name=sheet
+                )
+        writer.close()
+
+
+class CSVExporter(Exporter):
+    """
+    Writes each sheet in its own CSV file. Tables are streamed by chunks of
+    **chunk_size** rows, without intermediate DataFrame.
+    """
+
+    extension = "csv"
+    chunk_size = 65536
+
+    def export(self, directory: str, basename: str, sheets: dict) -> None:
+        for name, table in self._ordered(sheets):
+            columns = self.columns(table)
+            filepath = os.path.join(directory, "{0}.{1}.{2}".format(
+                basename, name, self.extension
+            ))
+            length = len(next(iter(columns.values()))) if columns else 0
+            with open(filepath, "w", newline="") as fout:
+                writer = csv.writer(fout)
+                writer.writerow(columns.keys())
+                for start in range(0, length, self.chunk_size):
+                    writer.writerows(zip(*(
+                        np.asarray(values[start:start + self.chunk_size])
+                        .tolist() for values in columns.values()
+                    )))
+
+
+class ParquetExporter(Exporter):
+    """
+    Writes each sheet in its own Parquet file. Requires pyarrow or
+    fastparquet.
+    """
+
+    extension = "parquet"
+
+    def _write(self, dataframe, filepath: str) -> None:
+        dataframe.to_parquet(filepath)
+
+    def export(self, directory: str, basename: str, sheets: dict) -> None:
+        for name, table in self._ordered(sheets):
+            self._write(self.dataframe(table), os.path.join(
+                directory, "{0}.{1}.{2}".format(
+                    basename, name, self.extension
+                )
+            ))
+
+
+class FeatherExporter(ParquetExporter):
+    """
+    Writes each sheet in its own Feather file. Requires pyarrow.
+    """
+
+    extension = "feather"
+
+    def _write(self, dataframe, filepath: str) -> None:
+        dataframe.reset_index(drop=True).to_feather(filepath)
+
+
+class NPZExporter(Exporter):
+    """
+    Writes every sheet in a single numpy .npz archive, each column being
+    stored under a "sheet.column" key.
+    """
+
+    extension = "npz"
+
+    def path(self, directory: str, basename: str) -> str:
+        return os.path.join(directory, "{0}.{1}".format(
+            basename, self.extension
+        ))
+
+    def export(self, directory: str, basename: str, sheets: dict) -> None:
+        arrays = OrderedDict()
+        for name, table in sheets.items():
+            for column, values in self.columns(table).items():
+                arrays["{0}.{1}".format(name, column)] = np.asarray(values)
+        temporary = self.path(directory, basename) + ".tmp"
+        with open(temporary, "wb") as fout:
+            np.savez(fout, **arrays)
+        os.replace(temporary, self.path(directory, basename))
+
+
+EXPORTERS = OrderedDict([
+    ('xlsx', ExcelExporter),
+    ('csv', CSVExporter),
+    ('parquet', ParquetExporter),
+    ('feather', FeatherExporter),
+    ('npz', NPZExporter)
+])
+
+
+def exporter(export_format: str) -> Exporter:
+    """
+    Instanciates the exporter of the given format.
+
+    :param export_format:   One of EXPORTERS keys.
+    :type export_format:    str
+    :return:                The exporter.
+    :rtype:                 Exporter
+    """
+    if export_format not in EXPORTERS:
+        raise ValueError("Unknown export format %s, expected one of %s" % (
+            export_format, ", ".join(EXPORTERS)
+        ))
+    return EXPORTERS[export_format]()
@@ -13,17 +13,19 @@ Part of the **PyCeption** package.
 
 from abc import ABCMeta
 
+from .GazeFrame import GazeFrame
+
 
 class FixationDetector(metaclass=ABCMeta):
     """
     Abstract class intented to be inherited by any class which purpose would be
     to translate gaze data into fixation data.
     """
-    def fixation(self, points: list) -> list:
+    def fixation(self, points: list or GazeFrame) -> list:
         """
         Transalates timed cartesian coordinates into fixations.
 
-        :param points:  The timed cartesian coordinates list.
-        :type points:   list
+        :param points:  The timed cartesian coordinates list or frame.
+        :type points:   list or GazeFrame
         """
         raise NotImplementedError("Call to abstract class.")
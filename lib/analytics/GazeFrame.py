@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class GazeFrame(object):
+    """
+    Compact struct-of-arrays container for timed gaze samples. Each column is
+    stored as a contiguous numpy array sharing the frame length, which costs a
+    few bytes per sample where a list of dictionnaries costs hundreds.
+
+    Columns are reachable by name either as attributes or through indexing::
+
+        frame = GazeFrame(timestamps, xs, ys)
+        frame.x is frame["x"]
+        frame["speed"] = speeds
+        head = frame[:100]  # zero-copy view
+        sample = frame[0]  # {'timestamp': ..., 'x': ..., 'y': ...}
+
+    Slicing returns a new frame whose columns are views on the original
+    arrays, while an integer returns the matching sample as a dictionnary. Conversion to a pandas DataFrame only happens on **to_dataframe**,
+    that is to say at export time.
+
+    .. seealso:: Experiment, IVT
+    """
+# ------------------------------------------------------------------- VARIABLES
+
+    dtypes = OrderedDict([
+        ('id', np.int64),
+        ('experiment', np.int64),
+        ('timestamp', np.float64),
+        ('x', np.float64),
+        ('y', np.float64),
+        ('frequence', np.float64),
+        ('speed', np.float64),
+        ('fixation', np.bool_)
+    ])
+
+# ----------------------------------------------------------------------- MAGIC
+
+    def __init__(self, timestamp: np.ndarray, x: np.ndarray, y: np.ndarray,
+                 **columns) -> None:
+        """
+        Class constructor. Builds the frame from the mandatory timed
+        coordinates columns and any additional named column.
+
+        :param timestamp:   The samples timestamps.
+        :param x:           The samples x coordinates.
+        :param y:           The samples y coordinates.
+        :param columns:     Additional columns, e.g id or fixation.
+        :type timestamp:    np.ndarray
+        :type x:            np.ndarray
+        :type y:            np.ndarray
+        """
+        object.__setattr__(self, "_columns", OrderedDict())
+        object.__setattr__(self, "_length", len(timestamp))
+        self["timestamp"] = timestamp
+        self["x"] = x
+        self["y"] = y
+        for name, values in columns.items():
+            self[name] = values
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return object.__getattribute__(self, "_columns")[name]
+        except KeyError:
+            raise AttributeError("GazeFrame has no column %s" % name)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._columns[key]
+        if isinstance(key, (int, np.integer)):
+            return OrderedDict(
+                (name, values[key].item())
+                for name, values in self._columns.items()
+            )
+        columns = OrderedDict(
+            (name, values[key]) for name, values in self._columns.items()
+        )
+        return GazeFrame(
+            columns.pop("timestamp"), columns.pop("x"), columns.pop("y"),
+            **columns
+        )
+
+    def __setitem__(self, name: str, values) -> None:
+        """
+        Adds or replaces the **name** column. Values are cast to the column
+        registered dtype, if any, without copy when already matching.
+        """
+        dtype = self.dtypes.get(name)
+        values = np.asarray(values, dtype=dtype)
+        if values.ndim != 1 or len(values) != self._length:
+            raise ValueError(
+                "Column %s length (%d) does not match frame length (%d)" % (
+                    name, len(values), self._length
+                )
+            )
+        self._columns[name] = values
+
+    def __repr__(self) -> str:
+        return "GazeFrame({0} samples, columns: {1})".format(
+            self._length, ", ".join(self._columns)
+        )
+
+# --------------------------------------------------------------------- METHODS
+
+    @staticmethod
+    def from_records(records: list) -> "GazeFrame":
+        """
+        Builds a frame from a list of dictionnaries, as returned by
+        **Repository.read**.
+
+        :param records: The key / value samples.
+        :type records:  list
+        :return:        The equivalent frame.
+        :rtype:         GazeFrame
+        """
+        if not records:
+            return GazeFrame.empty()
+        columns = OrderedDict()
+        for name in records[0].keys():
+            columns[name] = np.fromiter(
+                (record[name] for record in records),
+                dtype=GazeFrame.dtypes.get(name, np.float64),
+                count=len(records)
+            )
+        return GazeFrame.from_columns(columns)
+
+    @staticmethod
+    def from_columns(columns: dict) -> "GazeFrame":
+        """
+        Builds a frame from a name / values dictionnary, as returned by
+        **Repository.read_columns**. Columns keep their order.
+
+        :param columns: The named columns, timestamp, x and y included.
+        :type columns:  dict
+        :return:        The equivalent frame.
+        :rtype:         GazeFrame
+        """
+        frame = GazeFrame(
+            columns["timestamp"], columns["x"], columns["y"],
+            **{name: values for name, values in columns.items()
+               if name not in ("timestamp", "x", "y")}
+        )
+        # Keeps the records column order for exports
+        for name in columns:
+            frame._columns.move_to_end(name)
+        return frame
+
+    @staticmethod
+    def empty() -> "GazeFrame":
+        """
+        Builds a zero length frame.
+        """
+        return GazeFrame(np.empty(0), np.empty(0), np.empty(0))
+
+    def to_dataframe(self):
+        """
+        Converts this frame into a pandas DataFrame. Meant for export only.
+
+        :return:    The equivalent DataFrame.
+        :rtype:     pd.DataFrame
+        """
+        import pandas as pd
+        return pd.DataFrame(self._columns)
+
+# ------------------------------------------------------------------ PROPERTIES
+
+    @property
+    def columns(self) -> list:
+        return list(self._columns.keys())
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self._columns.values())
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import numpy as np
+
+
+class Heatmap(object):
+    """
+    Sparse heatmap accumulator. Rather than convolving a whole fixation
+    matrix, the kernel is stamped around each fixation, weighted by the
+    fixation time. The cost thus scales with the number of fixations times
+    the kernel area instead of the screen area.
+
+    Fixations can be added at any time, the heatmap being updated in place::
+
+        heatmap = Heatmap(Experiment.convolution_kernel)
+        heatmap.extend(experiment.fixation_points)
+        heatmap.add(960.0, 540.0, 0.250)
+        heatmap.matrix
+
+    Unlike the convolution backends, stamps are clipped at the screen edges
+    (zero boundary instead of reflection) and fixations sharing a pixel add up
+    instead of overwriting each other.
+
+    .. seealso:: Experiment, convolution
+    """
+# ----------------------------------------------------------------------- MAGIC
+
+    def __init__(self, kernel: np.ndarray, max_x: int = 1920,
+                 max_y: int = 1080, dtype: type = np.float64) -> None:
+        """
+        Class constructor. Initializes an empty **max_x** * **max_y** heatmap.
+
+        :param kernel:  The stamped kernel, must have odd dimensions.
+        :param max_x:   The length of the x axis of the recording support.
+        :param max_y:   The length of the y axis of the recording support.
+        :param dtype:   The heatmap values type.
+        :type kernel:   np.ndarray
+        :type max_x:    int
+        :type max_y:    int
+        :type dtype:    type
+        """
+        self.kernel = kernel
+        self.matrix = np.zeros((max_y, max_x), dtype=dtype)
+        self.count = 0
+        self._radius_y = kernel.shape[0] // 2
+        self._radius_x = kernel.shape[1] // 2
+
+# --------------------------------------------------------------------- METHODS
+
+    def add(self, x: float, y: float, time: float) -> None:
+        """
+        Stamps the kernel, weighted by **time**, centered on the (**x**,
+        **y**) pixel. Fixations outside of the screen are ignored.
+
+        :param x:       The fixation x coordinate.
+        :param y:       The fixation y coordinate.
+        :param time:    The fixation duration.
+        :type x:        float
+        :type y:        float
+        :type time:     float
+        """
+        max_y, max_x = self.matrix.shape
+        if float(x) > max_x - 1 or float(y) > max_y - 1 \
+                or float(x) < 0 or float(y) < 0:
+            return
+        x, y = int(x), int(y)
+
+        top = max(y - self._radius_y, 0)
+        bottom = min(y + self._radius_y + 1, max_y)
+        left = max(x - self._radius_x, 0)
+        right = min(x + self._radius_x + 1, max_x)
+
+        kernel_top = top - (y - self._radius_y)
+        kernel_left = left - (x - self._radius_x)
+        self.matrix[top:bottom, left:right] += time * self.kernel[
+            kernel_top:kernel_top + bottom - top,
+            kernel_left:kernel_left + right - left
+        ]
+        self.count += 1
+
+    def extend(self, fixations: list) -> "Heatmap":
+        """
+        Stamps every given fixation.
+
+        :param fixations:   The gravity points, as computed by
+                            **FixationDetector.fixation**.
+        :type fixations:    list
+        :return:            This heatmap, for chaining.
+        :rtype:             Heatmap
+        """
+        for fixation in fixations:
+            self.add(fixation["x"], fixation["y"], fixation["time"])
+        return self
+
+    def clear(self) -> None:
+        """
+        Resets the heatmap to zero.
+        """
+        self.matrix.fill(0)
+        self.count = 0
@@ -16,10 +16,10 @@ Part of the **PyCeption** package.
 
 import numpy as np
 
-import lib as pct
-from lib import Level, inheritdoc
+from lib import inheritdoc
 
 from .FixationDetector import FixationDetector
+from .GazeFrame import GazeFrame
 from .plan2d import Point, circle_matrix
 
 
@@ -43,17 +43,44 @@ class IVT(FixationDetector):
         :param threshold: The value, in pixel/s, to use to differenciate
         saccades from fixations.
         :type threshold: float
+        :param kernel_ray: The ray of the **kernel** disc matrix, only built
+        on first access.
+        :type kernel_ray: int
         """
         self.threshold = threshold
-        pct.log("Building {0}n ray kernel matrix...".format(str(kernel_ray)),
-                Level.DEBUG, "")
-        self.kernel = circle_matrix(kernel_ray, True)
-        pct.log(" Done", Level.DONE)
+        self.kernel_ray = kernel_ray
 
-    def fixation(self, points: list) -> list:
+    def fixation(self, points: list or GazeFrame) -> list:
+        if isinstance(points, GazeFrame):
+            points["speed"], points["fixation"] = self.speed_array(
+                points.timestamp, points.x, points.y
+            )
+            return self.collapse_array(
+                points.timestamp, points.x, points.y, points.fixation
+            )
         self.speed(points)
         return self.collapse(points)
 
+    def fixation_array(self, timestamp: np.ndarray, x: np.ndarray,
+                       y: np.ndarray) -> list:
+        """
+        Array-backed counterpart of **fixation**. Translates timed cartesian
+        coordinates columns into fixations without iterating over samples.
+        The returned gravity points are identical to the ones **fixation**
+        would compute on the equivalent list of dictionnaries.
+
+        :param timestamp:   The samples timestamps.
+        :param x:           The samples x coordinates.
+        :param y:           The samples y coordinates.
+        :type timestamp:    np.ndarray
+        :type x:            np.ndarray
+        :type y:            np.ndarray
+        :return:            The list of gravity points
+        :rtype:             list
+        """
+        _, fixation = self.speed_array(timestamp, x, y)
+        return self.collapse_array(timestamp, x, y, fixation)
+
     def speed(self, points: list) -> dict:
         """
         Computes the speeds and fixation from the given timed coordinates
@@ -83,6 +110,41 @@ class IVT(FixationDetector):
 
         return points.pop(0)
 
+    def speed_array(self, timestamp: np.ndarray, x: np.ndarray,
+                    y: np.ndarray) -> np.ndarray and np.ndarray:
+        """
+        Vectorized counterpart of **speed**. Computes the speed and fixation
+        status of every sample from the given columns. Columns are left
+        untouched: the first sample, which has no predecessor, is given a NaN
+        speed and is never considered a fixation.
+
+        :param timestamp:   The samples timestamps.
+        :param x:           The samples x coordinates.
+        :param y:           The samples y coordinates.
+        :type timestamp:    np.ndarray
+        :type x:            np.ndarray
+        :type y:            np.ndarray
+        :return:            The speeds and the fixation mask.
+        :rtype:             np.ndarray and np.ndarray
+        """
+        timestamp = np.asarray(timestamp, dtype=np.float64)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        speed = np.full(len(timestamp), np.nan)
+        fixation = np.zeros(len(timestamp), dtype=bool)
+        if len(timestamp) < 2:
+            return speed, fixation
+
+        dist_x = np.diff(x)
+        dist_y = np.diff(y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            speed[1:] = np.sqrt(dist_x * dist_x + dist_y * dist_y) \
+                / np.abs(np.diff(timestamp))
+        fixation[1:] = speed[1:] < self.threshold
+
+        return speed, fixation
+
     def collapse(self, points: list) -> list:
         """
         Analyzes within the given set of data the fixation status of every
@@ -143,6 +205,49 @@ class IVT(FixationDetector):
 
         return gravity_points
 
+    def collapse_array(self, timestamp: np.ndarray, x: np.ndarray,
+                       y: np.ndarray, fixation: np.ndarray) -> list:
+        """
+        Vectorized counterpart of **collapse**. Runs of consecutive fixations
+        are delimited from the fixation mask boundaries, then collapsed into
+        their gravity center.
+
+        Gravity centers are accumulated sequentially (through cumsum) so that
+        the results are bitwise identical to **collapse**.
+
+        :param timestamp:   The samples timestamps.
+        :param x:           The samples x coordinates.
+        :param y:           The samples y coordinates.
+        :param fixation:    The fixation mask as computed by **speed_array**.
+        :type timestamp:    np.ndarray
+        :type x:            np.ndarray
+        :type y:            np.ndarray
+        :type fixation:     np.ndarray
+        :return:            The list of gravity points
+        :rtype:             list
+        """
+        timestamp = np.asarray(timestamp, dtype=np.float64)
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+
+        edges = np.diff(np.concatenate((
+            [0], np.asarray(fixation, dtype=np.int8), [0]
+        )))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+
+        times = np.abs(timestamp[ends - 1] - timestamp[starts])
+        gravity_points = list()
+        for start, end, time in zip(starts, ends, times):
+            length = int(end - start)
+            gravity_points.append({
+                'x': float(np.cumsum(x[start:end])[-1]) / length,
+                'y': float(np.cumsum(y[start:end])[-1]) / length,
+                'time': float(time)
+            })
+
+        return gravity_points
+
     def matrix(self, gravities: list, max_x=1920, max_y=1080) -> np.ndarray:
         """
         Places the **gravities** gravity points in a newly created **max_x** *
@@ -164,3 +269,7 @@ class IVT(FixationDetector):
                 continue
             base[int(point["y"]), int(point["x"])] = point["time"]
         return base
+
+    @property
+    def kernel(self) -> np.ndarray:
+        return circle_matrix(self.kernel_ray, True)
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import os
+import hashlib
+
+import numpy as np
+
+
+class ResultCache(object):
+    """
+    Content addressed, size bounded cache of analysis results.
+
+    Entries are identified by a key hashed from whatever the results depend
+    on (e.g database, experiment id, fingerprint, algorithm configuration),
+    so that a stale entry is simply never requested again. Arrays are stored
+    as .npz archives, heatmaps as float32 .npy files which are memory-mapped
+    when loaded.
+
+    Every access refreshes the entry modification time. Once the cache grows
+    beyond **max_size** bytes, least recently used entries are evicted.
+
+    .. seealso:: Experiment
+    """
+# ----------------------------------------------------------------------- MAGIC
+
+    def __init__(self, directory: str, max_size: int = 2 * 1024 ** 3) -> None:
+        """
+        Class constructor.
+
+        :param directory:   The cache directory, created on first store.
+        :param max_size:    The cache size limit, in bytes.
+        :type directory:    str
+        :type max_size:     int
+        """
+        self.directory = directory
+        self.max_size = max_size
+
+# --------------------------------------------------------------------- METHODS
+
+    @staticmethod
+    def key(*parts) -> str:
+        """
+        Hashes the given parts into an entry key.
+        """
+        return hashlib.sha1(
+            "\x1f".join(str(part) for part in parts).encode("utf-8")
+        ).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def _hit(self, path: str) -> bool:
+        if not os.path.isfile(path):
+            return False
+        os.utime(path, None)
+        return True
+
+    def _write(self, path: str, writer: callable) -> None:
+        """
+        Writes an entry through a temporary file, so that concurrent readers
+        never see a partially written entry.
+        """
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        temporary = "{0}.{1}.tmp".format(path, os.getpid())
+        with open(temporary, "wb") as fout:
+            writer(fout)
+        os.replace(temporary, path)
+        self.evict()
+
+    def load(self, key: str) -> dict:
+        """
+        Loads the **key** arrays entry.
+
+        :param key: The entry key.
+        :type key:  str
+        :return:    The name / array dictionnary or None when missing.
+        :rtype:     dict
+        """
+        path = self._path(key, ".npz")
+        if not self._hit(path):
+            return None
+        with np.load(path) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    def store(self, key: str, arrays: dict) -> None:
+        """
+        Stores the **arrays** name / array dictionnary as the **key** entry.
+        """
+        self._write(self._path(key, ".npz"),
+                    lambda fout: np.savez(fout, **arrays))
+
+    def load_matrix(self, key: str, mmap: bool = True) -> np.ndarray:
+        """
+        Loads the **key** matrix entry, memory-mapped and read-only by
+        default.
+
+        :param key:     The entry key.
+        :param mmap:    Whether to memory-map the matrix or read it.
+        :type key:      str
+        :type mmap:     bool
+        :return:        The matrix or None when missing.
+        :rtype:         np.ndarray
+        """
+        path = self._path(key, ".npy")
+        if not self._hit(path):
+            return None
+        return np.load(path, mmap_mode="r" if mmap else None)
+
+    def store_matrix(self, key: str, matrix: np.ndarray,
+                     dtype: type = np.float32) -> None:
+        """
+        Stores **matrix**, cast to **dtype**, as the **key** entry.
+        """
+        self._write(self._path(key, ".npy"),
+                    lambda fout: np.save(fout, np.asarray(matrix, dtype)))
+
+    def evict(self) -> None:
+        """
+        Removes least recently used entries until the cache fits in
+        **max_size** bytes.
+        """
+        entries = list()
+        for name in os.listdir(self.directory):
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            size -= entry_size
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+
+# ------------------------------------------------------------------ PROPERTIES
+
+    @property
+    def size(self) -> int:
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(
+            os.path.getsize(os.path.join(self.directory, name))
+            for name in os.listdir(self.directory)
+        )
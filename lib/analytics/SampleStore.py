@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class SampleStore(object):
+    """
+    Sidecar, memory-mapped copy of a database gaze samples. Each experiment
+    samples are stored as a (3, n) float64 .npy file, its rows being the
+    timestamp, x and y columns in timestamp order. Loaded columns are
+    read-only views on the file pages: analyses, including process pool
+    workers, share them through the OS page cache without copy.
+
+    Each experiment has a *<id>.json* sidecar holding the digest of the data
+    summary its samples were stored from, and its samples file is named
+    after that digest, *<id>.<digest>.npy*. A samples file is thus only
+    used while the database content it mirrors is unchanged. Every file is
+    written on its own through a temporary file, so that concurrent
+    processes storing different experiments never overwrite each other.
+
+    .. seealso:: Experiment.sync_samples
+    """
+# ------------------------------------------------------------------- VARIABLES
+
+    columns = ("timestamp", "x", "y")
+    _stores = dict()
+    _stores_lock = threading.Lock()
+
+# ----------------------------------------------------------------------- MAGIC
+
+    def __init__(self, directory: str) -> None:
+        """
+        Class constructor.
+
+        :param directory:   The store directory, created on first store.
+        :type directory:    str
+        """
+        self.directory = directory
+
+# --------------------------------------------------------------------- METHODS
+
+    @classmethod
+    def shared(cls, workdir: str, db_file: str) -> "SampleStore":
+        """
+        Returns the process wide store of the **db_file** database, located
+        in **workdir**/samples.
+
+        :param workdir:     The working directory.
+        :param db_file:     The database file path.
+        :type workdir:      str
+        :type db_file:      str
+        :return:            The database store.
+        :rtype:             SampleStore
+        """
+        db_file = os.path.abspath(db_file)
+        with cls._stores_lock:
+            if db_file not in cls._stores:
+                cls._stores[db_file] = cls(os.path.join(
+                    workdir, "samples", "{0}_{1}".format(
+                        os.path.splitext(os.path.basename(db_file))[0],
+                        hashlib.sha1(db_file.encode("utf-8")).hexdigest()[:8]
+                    )
+                ))
+            return cls._stores[db_file]
+
+    def path(self, experiment: int, digest: str) -> str:
+        return os.path.join(self.directory, "%d.%s.npy" % (experiment, digest))
+
+    def sidecar(self, experiment: int) -> str:
+        return os.path.join(self.directory, "%d.json" % experiment)
+
+    def _replace(self, path: str, write: callable, mode: str = "wb") -> None:
+        """
+        Writes **path** through a temporary file of this process and thread,
+        moved into place once complete.
+        """
+        temporary = "{0}.{1}.{2}.tmp".format(
+            path, os.getpid(), threading.get_ident()
+        )
+        with open(temporary, mode) as fout:
+            write(fout)
+        os.replace(temporary, path)
+
+    def _files(self, experiment: int) -> list:
+        """
+        The samples files of **experiment**, whatever their digest.
+        """
+        if not os.path.isdir(self.directory):
+            return list()
+        prefix = "%d." % experiment
+        return [os.path.join(self.directory, name)
+                for name in os.listdir(self.directory)
+                if name.startswith(prefix) and name.endswith(".npy")]
+
+    def digest(self, experiment: int) -> str:
+        """
+        The digest of the **experiment** stored samples, None if none.
+        """
+        try:
+            with open(self.sidecar(experiment), "r") as fin:
+                return json.load(fin)["digest"]
+        except (IOError, ValueError, KeyError, TypeError):
+            return None
+
+    def load(self, experiment: int, digest: str = None) -> OrderedDict:
+        """
+        Opens the **experiment** samples, memory-mapped and read-only.
+
+        :param experiment:  The experiment id.
+        :param digest:      The current data digest, the stored samples
+                            being ignored when it does not match.
+        :type experiment:   int
+        :type digest:       str
+        :return:            The column / array dictionnary, None when the
+                            samples are missing or stale.
+        :rtype:             OrderedDict
+        """
+        stored = self.digest(experiment)
+        if stored is None or (digest is not None and stored != digest):
+            return None
+        try:
+            samples = np.load(self.path(experiment, stored), mmap_mode="r")
+        except (IOError, ValueError):
+            return None
+        return OrderedDict(zip(self.columns, samples))
+
+    def store(self, experiment: int, columns: dict, digest: str) -> None:
+        """
+        Stores the **experiment** samples, mirroring data whose digest is
+        **digest**. The samples file is written before the sidecar pointing
+        to it, and files of former digests are removed last.
+
+        :param experiment:  The experiment id.
+        :param columns:     The timestamp, x and y columns.
+        :param digest:      The data digest.
+        :type experiment:   int
+        :type columns:      dict
+        :type digest:       str
+        """
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        samples = np.empty((len(self.columns), len(columns["timestamp"])))
+        for row, name in enumerate(self.columns):
+            samples[row] = columns[name]
+
+        path = self.path(experiment, digest)
+        self._replace(path, lambda fout: np.save(fout, samples))
+        self._replace(self.sidecar(experiment),
+                      lambda fout: json.dump({'digest': digest}, fout), "w")
+        for stale in self._files(experiment):
+            if stale != path:
+                self._remove(stale)
+
+    def remove(self, experiment: int) -> None:
+        """
+        Removes the **experiment** samples.
+        """
+        self._remove(self.sidecar(experiment))
+        for path in self._files(experiment):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        # Files still mapped elsewhere cannot be removed on some systems
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def sync(self, digests: dict, read: callable,
+             verify: bool = False) -> dict:
+        """
+        Brings the store in line with the database: experiments whose digest
+        changed, or which are missing, are (re)written from **read**, those
+        no longer in **digests** are removed.
+
+        With **verify**, stored experiments whose digest matches are also
+        compared, value by value, with **read**, and rewritten if they
+        differ.
+
+        :param digests: The experiment id / current data digest dictionnary.
+        :param read:    Reads an experiment columns from the database.
+        :param verify:  Whether to compare up to date experiments contents.
+        :type digests:  dict
+        :type read:     callable
+        :type verify:   bool
+        :return:        The lists of *written*, *removed* and *mismatched*
+                        (verified but different) experiments ids.
+        :rtype:         dict
+        """
+        result = {'written': list(), 'removed': list(), 'mismatched': list()}
+
+        for experiment in sorted(self.index):
+            if experiment not in digests:
+                self.remove(experiment)
+                result['removed'].append(experiment)
+
+        for experiment, digest in sorted(digests.items()):
+            stored = self.load(experiment, digest)
+            if stored is not None and not verify:
+                continue
+            columns = read(experiment)
+            if stored is not None:
+                if all(np.array_equal(stored[name], columns[name])
+                       for name in self.columns):
+                    continue
+                result['mismatched'].append(experiment)
+            self.store(experiment, columns, digest)
+            result['written'].append(experiment)
+        return result
+
+# ------------------------------------------------------------------ PROPERTIES
+
+    @property
+    def index(self) -> dict:
+        """
+        The experiment id / stored data digest dictionnary.
+        """
+        if not os.path.isdir(self.directory):
+            return dict()
+        retval = dict()
+        for name in os.listdir(self.directory):
+            stem, extension = os.path.splitext(name)
+            if extension == ".json" and stem.isdigit():
+                digest = self.digest(int(stem))
+                if digest is not None:
+                    retval[int(stem)] = digest
+        return retval
+
+    @property
+    def size(self) -> int:
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(
+            os.path.getsize(os.path.join(self.directory, name))
+            for name in os.listdir(self.directory)
+        )
@@ -14,11 +14,10 @@ Part of the **Pyception** package.
 import os
 import sys
 
-import matplotlib.pyplot as plt
-
 import lib as pct
-from lib import SETTINGS, Level, Repository
+from lib import SETTINGS, Level, Repository, lazy_attribute
 from .Experiment import Experiment
+from .Writer import Writer
 
 
 class Subject(object):
@@ -30,17 +29,25 @@ class Subject(object):
     """
 # ------------------------------------------------------------------- VARIABLES
 
-    db_file = SETTINGS["db_file"]
-    repository = Repository(db_file)
+    @lazy_attribute
+    def repository(cls):
+        return Repository.shared(SETTINGS["db_file"])
 
 # ----------------------------------------------------------------------- MAGIC
 
-    def __init__(self, name: str, repo: Repository = None) -> None:
+    def __init__(self, name: str, repo: Repository = None,
+                 description: dict = None, pull: bool = True) -> None:
         """
         Class constructor. Intializes important variables.
 
-        :param name:    The name of the subject.
-        :type name:     str
+        :param name:        The name of the subject.
+        :param repo:        The repository, default to **Subject.repository**.
+        :param description: The subjects table record, pulled if omitted.
+        :param pull:        Whether to pull the subject experiments.
+        :type name:         str
+        :type repo:         Repository
+        :type description:  dict
+        :type pull:         bool
         """
         self.name = name
         self.directory = os.path.join(SETTINGS["analytics_dir"], self.name)
@@ -48,44 +55,135 @@ class Subject(object):
         self._control = None
 
         self.repository = self.repository if repo is None else repo
-        self._load()
+        self._load(description)
 
         self.experiments = list()
-        self.pull()
+        self.failures = list()
+        if pull:
+            self.pull()
 
 # --------------------------------------------------------------------- METHODS
 
-    def _load(self):
+    def _load(self, description: dict = None):
         """
         Deferred class constructor, loads important values from the database.
+
+        :param description: The subjects table record, pulled if omitted.
+        :type description:  dict
         """
-        pct.log("Retreiving subject %s description..." % self.name,
-                Level.DEBUG, linesep="")
-        data = self.repository.read({'name': self.name}, "subjects")[0]
-        if not data:
-            pct.log(" Failed", Level.FAILED)
-            pct.log("Subject does not exist in database.", Level.WARNING)
-            return
-        pct.log(" Done", Level.DONE)
-        self.id = data["id"]
-        self._control = data["control"] == 1
+        if description is None:
+            pct.log("Retreiving subject %s description..." % self.name,
+                    Level.DEBUG, linesep="")
+            descriptions = self.repository.read({'name': self.name},
+                                                "subjects")
+            if not descriptions:
+                pct.log(" Failed", Level.FAILED)
+                pct.log("Subject does not exist in database.", Level.WARNING)
+                return
+            description = descriptions[0]
+            pct.log(" Done", Level.DONE)
+        self.id = description["id"]
+        self._control = description["control"] == 1
 
     def pull(self) -> None:
-        '''
-        TODO
-        '''
+        """
+        Batch loads this subject's experiments: their descriptions, areas of
+        interest and data summaries are pulled in four queries whatever the
+        number of experiments. Raw data are left in the database until an
+        experiment is analyzed.
+        """
         pct.log("Retreiving %s experiments descriptions..." % self.name,
                 Level.DEBUG, linesep="")
         experiments = self.repository.read({'subject': self.id}, "experiments")
+        ids = [experiment["id"] for experiment in experiments]
+
+        links = self.repository.read({'experiment': ids}, "experiments_aois")
+        aoi_defs = self.repository.read({
+            'id': sorted(set(link["aoi"] for link in links))
+        }, "aois")
+        summaries = Experiment.data_summary(self.repository, ids)
         pct.log(" Done", Level.DONE)
+
+        self._populate(experiments, links, aoi_defs, summaries)
+
+    def _populate(self, experiments: list, links: list, aoi_defs: list,
+                  summaries: list) -> None:
+        """
+        Builds this subject's experiments from prefetched records.
+
+        :param experiments: The subject experiments table records.
+        :param links:       The experiments_aois records of (at least) those
+                            experiments.
+        :param aoi_defs:    The aois records of (at least) those links.
+        :param summaries:   The experiments data summaries, including the
+                            experiment id, see **Experiment.data_summary**.
+        :type experiments:  list
+        :type links:        list
+        :type aoi_defs:     list
+        :type summaries:    list
+        """
+        areas = {
+            aoi_def["id"]: Experiment.area(aoi_def) for aoi_def in aoi_defs
+        }
+        aois = {experiment["id"]: list() for experiment in experiments}
+        for link in links:
+            if link["experiment"] in aois:
+                aois[link["experiment"]].append(areas[link["aoi"]])
+
+        data_summaries = dict()
+        for summary in summaries:
+            summary = dict(summary)
+            data_summaries[summary.pop("experiment")] = summary
+
         for experiment in experiments:
-            self.experiments.append(Experiment(experiment["name"], self))
+            self.experiments.append(Experiment(
+                experiment["name"], self, experiment,
+                aois[experiment["id"]], data_summaries.get(experiment["id"])
+            ))
+
+    @classmethod
+    def load_all(cls, repository: Repository,
+                 summaries: bool = True) -> list:
+        """
+        Loads every subject of **repository** along with their experiments
+        in five queries, raw data excepted.
+
+        :param repository:  The queried repository.
+        :param summaries:   Whether to compute the experiments data
+                            summaries, otherwise computed on first use.
+        :type repository:   Repository
+        :type summaries:    bool
+        :return:            The subjects.
+        :rtype:             list
+        """
+        experiments = dict()
+        for experiment in repository.read("experiments"):
+            experiments.setdefault(experiment["subject"], list()).append(
+                experiment
+            )
+        links = repository.read("experiments_aois")
+        aoi_defs = repository.read("aois")
+        summaries = Experiment.data_summary(repository) if summaries \
+            else list()
+
+        subjects = list()
+        for description in repository.read("subjects"):
+            subject = cls(description["name"], repository, description,
+                          pull=False)
+            subject._populate(experiments.get(subject.id, list()), links,
+                              aoi_defs, summaries)
+            subjects.append(subject)
+        return subjects
 
     def analyze(self, draw_heatmap: bool = False) -> None:
         """
-        TODO REMAKE
         Retreives this subject's experiments from the database before to
-        loop and analyze each of those.
+        loop and analyze each of those. Experiments whose saved results
+        fingerprint still matches their data, areas of interest and
+        parameters are skipped, unless **Experiment.refresh** is set.
+
+        An experiment failing does not stop the analysis: the error is logged
+        and recorded in **failures** as an (experiment name, error) tuple.
         """
         pct.log("Beginning subject {0} experiments analysis...".format(
             self.id
@@ -93,47 +191,79 @@ class Subject(object):
 
         if not self.experiments:
             self.pull()
+        self.failures = list()
         for experiment in self.experiments:
+            if not experiment.refresh and experiment.saved_analysis:
+                pct.log("Experiment {0} analysis up to date, skipping.".format(
+                    experiment.id
+                ), Level.DEBUG)
+                continue
             try:
                 experiment.analyze()
                 if draw_heatmap and experiment.analyzed:
                     experiment.make_heatmap()
             except Exception as e:
                 pct.log(e, Level.EXCEPTION)
-                pct.log("A fatal error occured. Exiting...", Level.ERROR)
-                sys.exit(-1)
-            except KeyboardInterrupt as ki:
+                pct.log("Experiment %s analysis failed." % experiment.name,
+                        Level.ERROR)
+                self.failures.append((experiment.name, repr(e)))
+            except KeyboardInterrupt:
                 print("")
                 pct.log("Keyboard Interrupt. Exiting...", Level.INFORMATION)
                 sys.exit(0)
 
-        pct.log("Experiments analysis completed successfully.",
-                Level.INFORMATION)
+        if self.failures:
+            pct.log("Experiments analysis completed with {0} failure(s)."
+                    .format(len(self.failures)), Level.WARNING)
+        else:
+            pct.log("Experiments analysis completed successfully.",
+                    Level.INFORMATION)
 
-    def save(self):
+    def save(self, writer: Writer = None):
         """
-        Save every analyzed experiments.
+        Save every analyzed experiments. When a **writer** is given, results
+        exports and heatmap images are written in the background, the caller
+        being in charge of flushing it.
+
+        :param writer:  The background writer, None to write synchronously.
+        :type writer:   Writer
         """
         for experiment in self.experiments:
-            experiment.save()
-            if experiment.heatmap is not None:
-                plt.imsave(
-                    os.path.join(experiment.directory, "heatmap.png"),
-                    experiment.heatmap,
-                    cmap='nipy_spectral'
-                )
-
-                fig, img, clrb = experiment.figure()
-                fig.savefig(
-                    os.path.join(experiment.directory, "heatmap_figure.png")
-                )
-                fig.clear()
+            if writer is None:
+                self._save_experiment(experiment)
+            else:
+                # The repository connection belongs to this thread: the
+                # fingerprint is queried before handing the experiment over
+                if experiment.persistent:
+                    experiment.fingerprint
+                writer.submit(self._save_experiment, experiment,
+                              tag=(self.name, experiment.name))
+
+    def is_saved(self, any_format: bool = False) -> bool:
+        """
+        Whether every experiment of this subject has up to date saved
+        results.
+
+        :param any_format:  Whether results exported in any format count, or
+                            only those of the current export format.
+        :type any_format:   bool
+        :return:            Whether the subject analysis is saved.
+        :rtype:             bool
+        """
+        return all(experiment.is_saved(any_format=any_format)
+                   for experiment in self.experiments)
+
+    @staticmethod
+    def _save_experiment(experiment: Experiment) -> None:
+        """
+        Writes **experiment** results and heatmap images.
+        """
+        experiment.save()
+        if experiment.heatmap is not None:
+            experiment.save_heatmap()
 
 # ------------------------------------------------------------------ PROPERTIES
 
     @property
     def saved_analysis(self):
-        sa = True
-        for experiment in self.experiments:
-            sa = sa and experiment.saved_analysis
-        return sa
+        return self.is_saved()
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import lib as pct
+from lib import Level
+
+
+class Writer(object):
+    """
+    Bounded background writer. Output writing tasks (exports, images) are
+    run by a pool of threads so that disk I/O and encoding overlap with the
+    next analysis.
+
+    At most **max_pending** tasks are queued or running at once: **submit**
+    blocks beyond that, which keeps the memory held by pending results
+    bounded. Errors do not interrupt the pool, they are collected and
+    returned by **flush**::
+
+        writer = Writer()
+        for subject in subjects:
+            subject.analyze()
+            subject.save(writer)
+        errors = writer.flush()
+    """
+# ----------------------------------------------------------------------- MAGIC
+
+    def __init__(self, workers: int = 2, max_pending: int = 4) -> None:
+        """
+        Class constructor.
+
+        :param workers:     The number of writing threads.
+        :param max_pending: The maximum number of queued or running tasks.
+        :type workers:      int
+        :type max_pending:  int
+        """
+        self._pool = ThreadPoolExecutor(workers)
+        self._slots = threading.BoundedSemaphore(max(max_pending, workers))
+        self._lock = threading.Lock()
+        self._futures = set()
+        self._errors = list()
+
+    def __enter__(self) -> "Writer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+# --------------------------------------------------------------------- METHODS
+
+    def submit(self, function: callable, *args, tag: object = None,
+               **kwargs) -> None:
+        """
+        Queues **function** for execution, blocking while **max_pending**
+        tasks are already queued or running.
+
+        :param function:    The writing task.
+        :param tag:         Identifies the task in the reported errors.
+        :type function:     callable
+        :type tag:          object
+        """
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(function, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        future.tag = tag
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._done)
+
+    def _done(self, future) -> None:
+        with self._lock:
+            self._collect(future)
+        self._slots.release()
+
+    def _collect(self, future) -> None:
+        """
+        Forgets the completed **future**, recording its error if any. Must be
+        called with **_lock** held; a future is only collected once, either
+        by its done callback or by **flush**.
+        """
+        if future not in self._futures:
+            return
+        self._futures.discard(future)
+        if future.exception() is not None:
+            self._errors.append((future.tag, repr(future.exception())))
+
+    def flush(self) -> list:
+        """
+        Waits for every queued task to complete and reports their errors.
+
+        :return:    The (tag, error) tuples of the failed tasks since the
+                    previous flush.
+        :rtype:     list
+        """
+        waited = set()
+        while True:
+            with self._lock:
+                futures = self._futures - waited
+            if not futures:
+                break
+            wait(futures)
+            waited |= futures
+
+        with self._lock:
+            # Done callbacks may run after wait returns
+            for future in waited:
+                self._collect(future)
+            errors, self._errors = self._errors, list()
+        for tag, error in errors:
+            pct.log("Writing {0} failed: {1}".format(tag, error), Level.ERROR)
+        return errors
+
+    def close(self) -> list:
+        """
+        Flushes and terminates the writing threads.
+
+        :return:    See **flush**.
+        :rtype:     list
+        """
+        errors = self.flush()
+        self._pool.shutdown()
+        return errors
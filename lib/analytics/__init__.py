@@ -1,4 +1,9 @@
 from .plan2d import Point, Area, matrix, circle_matrix
+from .GazeFrame import GazeFrame
+from .Heatmap import Heatmap
+from .ResultCache import ResultCache
+from .SampleStore import SampleStore
+from .Writer import Writer
 from .FixationDetector import FixationDetector
 from .IVT import IVT
 from .Subject import Subject
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+
+Heatmap convolution backends. For odd-sized kernels, such as the circle and
+gaussian ones, every backend computes the same convolution as
+**scipy.ndimage.convolve** with its default *reflect* boundary mode. Even-sized
+kernels have no center pixel, their origin being ambiguous: only the
+**direct** backend accepts them.
+
+- **direct**: the reference, spatial domain convolution ;
+- **fft**: frequency domain convolution, the kernel spectrum being cached for
+  every (resolution, kernel) couple so that experiments sharing a screen
+  resolution only transform their own matrix ;
+- **separable**: sum of 1D convolutions over the kernel singular value
+  decomposition, exact for separable kernels (e.g **gaussian_kernel**) and an
+  approximation bounded by **tolerance** otherwise. Kernels needing more than
+  **SEPARABLE_MAX_RANK** terms, such as the circle kernels, are convolved by
+  the **fft** backend instead.
+"""
+
+import hashlib
+
+import numpy as np
+
+BACKENDS = ("direct", "fft", "separable")
+SEPARABLE_MAX_RANK = 4
+
+_spectrums = dict()
+_decompositions = dict()
+
+
+def _digest(kernel: np.ndarray) -> str:
+    return hashlib.sha1(np.ascontiguousarray(kernel).tobytes()).hexdigest()
+
+
+def _fast_length(length: int) -> int:
+    """
+    Returns the smallest 5-smooth number (2^a * 3^b * 5^c) greater or equal to
+    **length**, sizes for which FFTs are the fastest.
+    """
+    while True:
+        remainder = length
+        for prime in (2, 3, 5):
+            while remainder % prime == 0:
+                remainder //= prime
+        if remainder == 1:
+            return length
+        length += 1
+
+
+def direct(matrix: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Reference spatial convolution. Cost grows with matrix area * kernel area.
+    """
+    from scipy.ndimage import convolve
+    return convolve(matrix, kernel)
+
+
+def fft(matrix: np.ndarray, kernel: np.ndarray) -> np.ndarray:
+    """
+    Frequency domain convolution. The matrix is padded by reflection so that
+    borders match the **direct** backend, and the kernel spectrum is reused
+    across calls with the same resolution.
+    """
+    pad_y, pad_x = kernel.shape[0] // 2, kernel.shape[1] // 2
+    padded = np.pad(
+        matrix,
+        ((pad_y, kernel.shape[0] - 1 - pad_y),
+         (pad_x, kernel.shape[1] - 1 - pad_x)),
+        mode="symmetric"
+    )
+    shape = (
+        _fast_length(padded.shape[0] + kernel.shape[0] - 1),
+        _fast_length(padded.shape[1] + kernel.shape[1] - 1)
+    )
+
+    key = (shape, kernel.shape, _digest(kernel))
+    if key not in _spectrums:
+        _spectrums[key] = np.fft.rfft2(kernel, shape)
+    spectrum = _spectrums[key]
+
+    full = np.fft.irfft2(np.fft.rfft2(padded, shape) * spectrum, shape)
+    start_y, start_x = kernel.shape[0] - 1, kernel.shape[1] - 1
+    return full[start_y:start_y + matrix.shape[0],
+                start_x:start_x + matrix.shape[1]]
+
+
+def decompose(kernel: np.ndarray, tolerance: float = 1e-3) -> list:
+    """
+    Decomposes **kernel** into the shortest sum of outer products (vertical,
+    horizontal 1D kernels) whose reconstruction error stays below
+    **tolerance** times the kernel maximum.
+
+    :param kernel:      The 2D kernel.
+    :param tolerance:   The maximum relative reconstruction error.
+    :type kernel:       np.ndarray
+    :type tolerance:    float
+    :return:            The list of (vertical, horizontal) 1D kernels.
+    :rtype:             list
+    """
+    key = (kernel.shape, _digest(kernel), tolerance)
+    if key in _decompositions:
+        return _decompositions[key]
+
+    u, s, vt = np.linalg.svd(kernel)
+    bound = tolerance * np.abs(kernel).max()
+    approximation = np.zeros(kernel.shape)
+    terms = list()
+    for rank in range(len(s)):
+        column = u[:, rank] * np.sqrt(s[rank])
+        row = vt[rank] * np.sqrt(s[rank])
+        terms.append((column, row))
+        approximation += np.outer(column, row)
+        if np.abs(kernel - approximation).max() <= bound:
+            break
+
+    _decompositions[key] = terms
+    return terms
+
+
+def separable(matrix: np.ndarray, kernel: np.ndarray,
+              tolerance: float = 1e-3,
+              max_rank: int = SEPARABLE_MAX_RANK) -> np.ndarray:
+    """
+    Separable convolution, one pair of 1D convolutions per decomposition term.
+    Past **max_rank** terms, 1D passes cost more than a frequency domain
+    convolution: the **fft** backend is used instead.
+
+    .. seealso:: decompose
+    """
+    terms = decompose(kernel, tolerance)
+    if len(terms) > max_rank:
+        return fft(matrix, kernel)
+
+    from scipy.ndimage import convolve1d
+    retval = np.zeros(matrix.shape)
+    for column, row in terms:
+        retval += convolve1d(convolve1d(matrix, column, axis=0), row, axis=1)
+    return retval
+
+
+def convolve(matrix: np.ndarray, kernel: np.ndarray,
+             backend: str = "fft") -> np.ndarray:
+    """
+    Convolves **matrix** by **kernel** with the given backend. Even-sized
+    kernels are only accepted by the **direct** backend.
+
+    :param matrix:  The convolved matrix, e.g a fixation matrix.
+    :param kernel:  The convolution kernel.
+    :param backend: One of BACKENDS.
+    :type matrix:   np.ndarray
+    :type kernel:   np.ndarray
+    :type backend:  str
+    :return:        The convolution result, same shape as **matrix**.
+    :rtype:         np.ndarray
+
+    :raise ValueError
+    """
+    if backend == "direct":
+        return direct(matrix, kernel)
+    if not all(size % 2 for size in kernel.shape):
+        raise ValueError("The %s backend expects an odd-sized kernel, got "
+                         "%dx%d" % (backend, kernel.shape[1], kernel.shape[0]))
+    if backend == "fft":
+        return fft(matrix, kernel)
+    if backend == "separable":
+        return separable(matrix, kernel)
+    raise ValueError("Unknown convolution backend %s, expected one of %s" % (
+        backend, ", ".join(BACKENDS)
+    ))
+
+
+def gaussian_kernel(sigma: float, radius: int = None) -> np.ndarray:
+    """
+    Creates a 2D gaussian kernel peaking at 1.0. Gaussian kernels are exactly
+    separable, which makes them the kernel of choice for the **separable**
+    backend.
+
+    :param sigma:   The gaussian standard deviation, in pixels.
+    :param radius:  The kernel radius, default to 3 sigmas.
+    :type sigma:    float
+    :type radius:   int
+    :return:        The (2 * radius + 1) square kernel.
+    :rtype:         np.ndarray
+    """
+    radius = int(np.ceil(3 * sigma)) if radius is None else radius
+    axis = np.exp(-np.arange(-radius, radius + 1) ** 2 / (2. * sigma ** 2))
+    return np.outer(axis, axis)
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+
+Databases overview for **--info**. Counts come from COUNT(*) aggregates and
+analysis completion from the saved fingerprint files, checked against the
+data rows count and id range: raw samples are never loaded, nor checksummed.
+Databases are opened read-only and scanned concurrently, sqlite releasing the
+GIL while it works.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from lib import Repository
+
+from .Experiment import Experiment
+from .Subject import Subject
+
+
+def database_info(db_file: str) -> dict:
+    """
+    Summarizes the **db_file** database content and analysis completion.
+
+    :param db_file: The database file path.
+    :type db_file:  str
+    :return:        The database name, path, size, subjects, experiments and
+                    samples counts, and the number of subjects whose saved
+                    analysis, in any export format, looks up to date (see
+                    **Experiment.is_saved** summary). Errors are reported
+                    under *error* rather than raised.
+    :rtype:         dict
+    """
+    retval = {
+        'name': os.path.basename(db_file),
+        'path': db_file,
+        'size': os.path.getsize(db_file),
+        'error': None
+    }
+    try:
+        repo = Repository(db_file, read_only=True)
+        subjects = Subject.load_all(repo, summaries=False)
+        summaries = dict()
+        for summary in Experiment.data_summary(repo, checksums=False):
+            summaries[summary.pop("experiment")] = summary
+        retval.update({
+            'subjects': repo.count("subjects"),
+            'experiments': repo.count("experiments"),
+            'samples': sum(summary["count"]
+                           for summary in summaries.values()),
+            'analyzed': sum(1 for subject in subjects if all(
+                experiment.is_saved(any_format=True, summary=summaries.get(
+                    experiment.id, {'count': 0}
+                )) for experiment in subject.experiments
+            ))
+        })
+        repo.close()
+    except Exception as e:
+        retval['error'] = repr(e)
+    return retval
+
+
+def scan(db_files: list, jobs: int = None) -> list:
+    """
+    Runs **database_info** over **db_files**, **jobs** databases at a time.
+
+    :param db_files:    The database files paths.
+    :param jobs:        The number of concurrent scans, default to one per
+                        database up to the number of processors.
+    :type db_files:     list
+    :type jobs:         int
+    :return:            The databases summaries, in **db_files** order.
+    :rtype:             list
+    """
+    if not db_files:
+        return list()
+    if jobs is None:
+        jobs = min(len(db_files), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max(jobs, 1)) as pool:
+        return list(pool.map(database_info, db_files))
@@ -1,6 +1,8 @@
+import os
 import math
 import numpy as np
-import scipy.ndimage.filters as filters
+
+_kernels = dict()
 
 
 class Point(object):
@@ -62,14 +64,59 @@ def matrix(points: list, max_x=1920, max_y=1080) -> np.ndarray:
         base[int(point["y"]), int(point["x"])] = point["time"]
     return base
 
-def circle_matrix(radius: int, gradient: bool = False) -> np.ndarray:
+def circle_matrix(radius: int, gradient: bool = False,
+                  dtype: type = np.float64,
+                  persist: bool = None) -> np.ndarray:
     """
     Creates a disc matrix with the given **r** radius.
 
-    :param r:   The disc radius.
-    :type r:    int
-    :return:    The computed gradient disc matrix.
-    :rtype:     np.ndarray
+    Kernels are memoized process-wide by (radius, gradient, dtype) and, when
+    **persist** is set (default to the *persist_kernels* setting), saved as
+    .npy files in the working directory so that later runs only load them.
+    Returned matrices are shared, hence read-only.
+
+    :param radius:      The disc radius.
+    :param gradient:    Whether the disc values fade from its center or not.
+    :param dtype:       The matrix values type.
+    :param persist:     Whether to persist the kernel in the working directory.
+    :type radius:       int
+    :type gradient:     bool
+    :type dtype:        type
+    :type persist:      bool
+    :return:            The computed gradient disc matrix.
+    :rtype:             np.ndarray
+    """
+    key = (int(radius), bool(gradient), np.dtype(dtype).name)
+    if key in _kernels:
+        return _kernels[key]
+
+    import lib as pct
+    persist = pct.SETTINGS.get("persist_kernels", False) if persist is None \
+        else persist
+    filepath = os.path.join(
+        pct.SETTINGS["workdir"], "kernels", "circle_%d_%d_%s.npy" % key
+    )
+
+    if persist and os.path.isfile(filepath):
+        retval = np.load(filepath)
+    else:
+        retval = _circle_matrix(radius, gradient).astype(dtype)
+        if persist:
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            temporary = "{0}.{1}.tmp".format(filepath, os.getpid())
+            with open(temporary, "wb") as fout:
+                np.save(fout, retval)
+            os.replace(temporary, filepath)
+
+    retval.setflags(write=False)
+    _kernels[key] = retval
+    return retval
+
+def _circle_matrix(radius: int, gradient: bool) -> np.ndarray:
+    """
+    Vectorized disc matrix construction, see **circle_matrix**.
+    Reproduces the historic nested loop values exactly, including its one
+    cell shift.
     """
     if gradient:
         grd = np.arange(0., 1. + 1./radius, 1./radius)
@@ -77,16 +124,11 @@ def circle_matrix(radius: int, gradient: bool = False) -> np.ndarray:
         grd = np.zeros(2 * radius + 2)
         grd[-1] = 1.0
     cpt = radius * 2 + 1
-    retval = np.zeros((cpt, cpt))
-    for i in range(cpt):
-        for j in range(cpt):
-            delta_i = radius + 1 - i
-            delta_j = radius + 1 - j
-            delta = math.sqrt(pow(delta_i, 2) + pow(delta_j, 2))
-            if delta > radius:
-                delta = len(grd) - 1
-            retval[i-1, j-1] = 1 - grd[int(delta)]
-    return retval
+    delta_i = (radius + 1 - np.arange(cpt)).astype(np.float64)
+    delta = np.sqrt(delta_i[:, np.newaxis] ** 2 + delta_i[np.newaxis, :] ** 2)
+    index = np.where(delta > radius, len(grd) - 1, delta.astype(np.intp))
+    # Loop cell (i, j) used to be written at (i - 1, j - 1)
+    return np.roll(1 - grd[index], (-1, -1), axis=(0, 1))
 
 def draw_line(target: np.ndarray, vertical: bool, c1: int, c2: int, axe: int) -> None:
     def set_cell(a, b, val):
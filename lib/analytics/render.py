@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+
+Heatmap image rendering without the pyplot state machine.
+
+Raw heatmap images are mapped through a precomputed colormap lookup table
+and encoded as PNG directly. Annotated figures are drawn on one reusable Agg
+figure per thread, so that background writers do not build, nor leak, a
+pyplot figure per experiment.
+"""
+
+import struct
+import threading
+import zlib
+
+import numpy as np
+
+_luts = dict()
+_local = threading.local()
+
+
+def colormap_lut(cmap: str) -> np.ndarray:
+    """
+    Builds, once per colormap, the RGBA lookup table of the **cmap**
+    matplotlib colormap.
+
+    :param cmap:    The colormap name, e.g nipy_spectral.
+    :type cmap:     str
+    :return:        The (N, 4) uint8 lookup table, N being the colormap size.
+    :rtype:         np.ndarray
+    """
+    if cmap not in _luts:
+        import matplotlib
+        try:
+            colormap = matplotlib.colormaps[cmap]
+        except AttributeError:
+            from matplotlib import cm
+            colormap = cm.get_cmap(cmap)
+        _luts[cmap] = colormap(np.arange(colormap.N), bytes=True)
+    return _luts[cmap]
+
+
+def to_rgba(matrix: np.ndarray, cmap: str = 'nipy_spectral',
+            vmin: float = None, vmax: float = None) -> np.ndarray:
+    """
+    Maps **matrix** values to colors the way matplotlib does, linearly
+    between **vmin** and **vmax** (default to the matrix extrema).
+
+    :param matrix:  The 2D values.
+    :param cmap:    The colormap name.
+    :param vmin:    The value mapped to the colormap first color.
+    :param vmax:    The value mapped to the colormap last color.
+    :type matrix:   np.ndarray
+    :type cmap:     str
+    :type vmin:     float
+    :type vmax:     float
+    :return:        The (height, width, 4) uint8 image.
+    :rtype:         np.ndarray
+    """
+    lut = colormap_lut(cmap)
+    vmin = float(np.min(matrix)) if vmin is None else vmin
+    vmax = float(np.max(matrix)) if vmax is None else vmax
+
+    if vmax == vmin:
+        index = np.zeros(matrix.shape, dtype=np.intp)
+    else:
+        scaled = (np.asarray(matrix, dtype=np.float64) - vmin) \
+            / (vmax - vmin) * len(lut)
+        index = np.clip(scaled, 0, len(lut) - 1).astype(np.intp)
+    return lut[index]
+
+
+def write_png(filepath: str, rgba: np.ndarray, level: int = 6) -> None:
+    """
+    Encodes an RGBA uint8 image as a PNG file.
+
+    :param filepath:    The destination file path.
+    :param rgba:        The (height, width, 4) uint8 image.
+    :param level:       The zlib compression level.
+    :type filepath:     str
+    :type rgba:         np.ndarray
+    :type level:        int
+    """
+    height, width = rgba.shape[:2]
+    # Each scanline starts with its filter type, 0 (None)
+    scanlines = np.zeros((height, width * 4 + 1), dtype=np.uint8)
+    scanlines[:, 1:] = rgba.reshape(height, width * 4)
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data \
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    with open(filepath, "wb") as fout:
+        fout.write(b"\x89PNG\r\n\x1a\n")
+        fout.write(chunk(b"IHDR", struct.pack(
+            ">IIBBBBB", width, height, 8, 6, 0, 0, 0
+        )))
+        fout.write(chunk(b"IDAT", zlib.compress(scanlines.tobytes(), level)))
+        fout.write(chunk(b"IEND", b""))
+
+
+def imsave(filepath: str, matrix: np.ndarray, cmap: str = 'nipy_spectral',
+           vmin: float = None, vmax: float = None) -> None:
+    """
+    Figure free counterpart of **pyplot.imsave**.
+    """
+    write_png(filepath, to_rgba(matrix, cmap, vmin, vmax))
+
+
+def figure(matrix: np.ndarray, cmap: str = 'nipy_spectral',
+           vmin: float = None, vmax: float = None) -> tuple:
+    """
+    Draws **matrix** along with a colorbar on this thread Agg figure. The
+    figure is reused by later calls from the same thread: save it before
+    drawing the next one.
+
+    :param matrix:  The 2D values.
+    :param cmap:    The colormap name.
+    :param vmin:    The value mapped to the colormap first color.
+    :param vmax:    The value mapped to the colormap last color.
+    :type matrix:   np.ndarray
+    :type cmap:     str
+    :type vmin:     float
+    :type vmax:     float
+    :return:        The figure, image and colorbar.
+    :rtype:         tuple
+    """
+    fig = getattr(_local, "figure", None)
+    if fig is None:
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        _local.figure = fig
+
+    fig.clear()
+    axes = fig.add_subplot(111)
+    image = axes.imshow(matrix, cmap=cmap, vmin=vmin, vmax=vmax)
+    colorbar = fig.colorbar(image, ax=axes)
+    return fig, image, colorbar
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+
+Subject level analysis tasks, run either serially or spread across a process
+pool. Each worker opens its own Repository connections and writes its own
+outputs, its log being buffered and printed by the parent process in subject
+order.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import lib as pct
+from lib import Level, Logger, Repository
+
+from .Subject import Subject
+from .Experiment import Experiment
+from .Exporter import exporter as make_exporter
+from .Writer import Writer
+
+
+def _options() -> dict:
+    """
+    Runtime settings a worker must share with its parent process, whatever
+    the process start method.
+    """
+    return {
+        'settings': {
+            'analytics_dir': pct.SETTINGS["analytics_dir"],
+            'logging_level': pct.SETTINGS["logging_level"],
+            'export_format': pct.SETTINGS["export_format"]
+        },
+        'refresh': Experiment.refresh
+    }
+
+
+def _writer() -> Writer:
+    return Writer(pct.SETTINGS.get("writer_threads", 2),
+                  pct.SETTINGS.get("writer_queue_size", 4))
+
+
+def analyze_subject(db_file: str, name: str, options: dict = None,
+                    buffered: bool = True, writer: Writer = None) -> dict:
+    """
+    Analyzes and saves the **name** subject of the **db_file** database.
+    Errors are caught and reported in the returned dictionnary rather than
+    raised, so that one failing subject does not abort the others.
+
+    Outputs are written in the background by **writer**. When none is given,
+    a writer is created and flushed before returning, its errors being
+    reported as failures.
+
+    :param db_file:     The database file path.
+    :param name:        The subject name.
+    :param options:     The parent process runtime settings.
+    :param buffered:    Whether to buffer the log output.
+    :param writer:      The shared background writer, flushed by the caller.
+    :type db_file:      str
+    :type name:         str
+    :type options:      dict
+    :type buffered:     bool
+    :type writer:       Writer
+    :return:            The subject name, buffered log, failed experiments
+                        and fatal error if any.
+    :rtype:             dict
+    """
+    if options is not None:
+        pct.SETTINGS.update(options['settings'])
+        Experiment.refresh = options['refresh']
+        Experiment.exporter = make_exporter(pct.SETTINGS["export_format"])
+    if buffered:
+        pct.logger = Logger(pct.SETTINGS["logging_level"], buffered=True)
+        pct.log = pct.logger.log
+
+    own_writer = writer is None
+    writer = _writer() if own_writer else writer
+
+    result = {'subject': name, 'log': "", 'failures': list(), 'error': None}
+    try:
+        repo = Repository.shared(db_file)
+        Subject.repository = repo
+        Experiment.repository = repo
+
+        subject = Subject(name, repo)
+        subject.analyze()
+        subject.save(writer)
+        result['failures'] = subject.failures
+    except Exception as e:
+        pct.log(e, Level.EXCEPTION)
+        result['error'] = repr(e)
+
+    if own_writer:
+        for (_, experiment), error in writer.close():
+            result['failures'].append((experiment, error))
+
+    if buffered:
+        result['log'] = pct.logger.flush()
+    return result
+
+
+def analyze(db_file: str, names: list, jobs: int = 1) -> list:
+    """
+    Analyzes and saves every **names** subjects, over **jobs** processes.
+    Logs are printed subject after subject, in the given order, and a
+    summary of the failed tasks is logged at the end.
+
+    :param db_file: The database file path.
+    :param names:   The subjects names.
+    :param jobs:    The number of worker processes, 1 to run in this process.
+    :type db_file:  str
+    :type names:    list
+    :type jobs:     int
+    :return:        The **analyze_subject** results, in **names** order.
+    :rtype:         list
+    """
+    results = list()
+    if jobs <= 1:
+        # Subjects outputs are written while the next subject is analyzed
+        with _writer() as writer:
+            for name in names:
+                results.append(analyze_subject(db_file, name, buffered=False,
+                                               writer=writer))
+            by_subject = {result['subject']: result for result in results}
+            for (subject, experiment), error in writer.flush():
+                by_subject[subject]['failures'].append((experiment, error))
+    else:
+        pct.log("Analyzing {0} subjects over {1} processes...".format(
+            len(names), jobs
+        ))
+        with ProcessPoolExecutor(jobs) as pool:
+            for result in pool.map(analyze_subject, repeat(db_file), names,
+                                   repeat(_options())):
+                print(result['log'], end="")
+                results.append(result)
+
+    failed = [result for result in results
+              if result['error'] or result['failures']]
+    for result in failed:
+        if result['error']:
+            pct.log("Subject {0} failed: {1}".format(
+                result['subject'], result['error']
+            ), Level.ERROR)
+        for experiment, error in result['failures']:
+            pct.log("Subject {0} experiment {1} failed: {2}".format(
+                result['subject'], experiment, error
+            ), Level.ERROR)
+    pct.log("{0}/{1} subject(s) analyzed without failure.".format(
+        len(results) - len(failed), len(results)
+    ))
+    return results
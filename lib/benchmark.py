@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **PyCeption** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import os
+import sys
+import subprocess
+from timeit import default_timer
+
+import numpy as np
+
+import lib as pct
+from lib import Level
+from .analytics import convolution, circle_matrix
+
+# The Experiment circle kernel is convolved by the fft fallback of the
+# separable backend, the gaussian one by its actual 1D passes
+HEATMAP_KERNELS = (
+    ("circle", lambda: circle_matrix(80, True)),
+    ("gaussian", lambda: convolution.gaussian_kernel(10))
+)
+
+
+def _timed(function, repeat: int) -> float and object:
+    """
+    Runs **function** **repeat** times and returns the best timing along
+    with the function result.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = default_timer()
+        result = function()
+        best = min(best, default_timer() - start)
+    return best, result
+
+
+def heatmap_backends(kernel: np.ndarray = None, fixations: int = 100,
+                     shape: tuple = (1080, 1920), repeat: int = 3,
+                     tolerance: float = 1e-9, seed: int = 0) -> dict:
+    """
+    Checks every convolution backend against the direct reference on a
+    random fixation matrix and times them.
+
+    The fft backend must match the reference within **tolerance** (relative
+    to the reference maximum). The separable backend is an approximation:
+    its error must stay below the bound implied by its decomposition
+    tolerance, that is to say the kernel reconstruction error times the
+    fixation matrix total weight.
+
+    :param kernel:      The convolution kernel, default to the Experiment one.
+    :param fixations:   The number of random fixations.
+    :param shape:       The fixation matrix shape.
+    :param repeat:      The number of timed runs per backend.
+    :param tolerance:   The relative tolerance of exact backends.
+    :param seed:        The random generator seed.
+    :return:            Per backend timing, error and equivalence status.
+    :rtype:             dict
+    """
+    kernel = circle_matrix(80, True) if kernel is None else kernel
+    random = np.random.RandomState(seed)
+    matrix = np.zeros(shape)
+    matrix[random.randint(0, shape[0], fixations),
+           random.randint(0, shape[1], fixations)] = random.rand(fixations)
+
+    pct.log("Benchmarking heatmap backends on a {0}x{1} matrix, {2}x{3} "
+            "kernel, {4} fixations...".format(
+                shape[1], shape[0], kernel.shape[1], kernel.shape[0],
+                fixations
+            ))
+
+    reference_time, reference = _timed(
+        lambda: convolution.direct(matrix, kernel), 1
+    )
+    scale = max(np.abs(reference).max(), 1.0)
+    bounds = {
+        'direct': 0.0,
+        'fft': tolerance * scale,
+        'separable': 1e-3 * np.abs(kernel).max() * np.abs(matrix).sum()
+                     + tolerance * scale
+    }
+
+    results = dict()
+    for backend in convolution.BACKENDS:
+        if backend == "direct":
+            elapsed, result = reference_time, reference
+        else:
+            elapsed, result = _timed(
+                lambda: convolution.convolve(matrix, kernel, backend), repeat
+            )
+        error = float(np.abs(result - reference).max())
+        results[backend] = {
+            'time': elapsed,
+            'error': error,
+            'equivalent': error <= bounds[backend]
+        }
+        pct.log("  {0:<10} {1:>9.3f}s  max error {2:.3e}".format(
+            backend, elapsed, error
+        ), linesep="")
+        pct.log(" OK" if results[backend]['equivalent'] else " MISMATCH",
+                Level.DONE if results[backend]['equivalent']
+                else Level.FAILED)
+
+    return results
+
+
+def heatmap_kernels(**kwargs) -> dict:
+    """
+    Runs **heatmap_backends** on every HEATMAP_KERNELS kernel, so that both
+    the separable and the fft paths of the separable backend are checked.
+
+    :param kwargs:  The heatmap_backends keyword arguments, kernel excepted.
+    :return:        The heatmap_backends results, per kernel name.
+    :rtype:         dict
+    """
+    return {name: heatmap_backends(kernel(), **kwargs)
+            for name, kernel in HEATMAP_KERNELS}
+
+
+def import_time(module: str = "lib", budget: float = None,
+                forbidden: tuple = ("matplotlib", "pandas", "scipy")) -> dict:
+    """
+    Measures, in a fresh interpreter (python -X importtime), the time spent
+    importing **module** and checks it against **budget**. Importing one of
+    the **forbidden** heavy modules is a failure too: those must only be
+    loaded on first use.
+
+    :param module:      The imported module.
+    :param budget:      The maximum import time, in seconds, default to the
+                        *import_time_budget* setting.
+    :param forbidden:   The modules which must not be imported.
+    :type module:       str
+    :type budget:       float
+    :type forbidden:    tuple
+    :return:            The import time, eagerly imported forbidden modules
+                        and budget status.
+    :rtype:             dict
+    """
+    budget = pct.SETTINGS.get("import_time_budget", 1.0) if budget is None \
+        else budget
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError("Unable to import %s:\n%s" % (
+            module, process.stderr
+        ))
+
+    # import time: self [us] | cumulative | imported package
+    cumulative = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = line[len("import time:"):].split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total) / 1e6
+
+    elapsed = cumulative.get(module, 0.0)
+    imported = sorted(name for name in forbidden if name in cumulative)
+    result = {
+        'time': elapsed,
+        'imported': imported,
+        'within_budget': elapsed <= budget and not imported
+    }
+
+    pct.log("  import {0:<14} {1:>7.3f}s  (budget {2:.3f}s)".format(
+        module, elapsed, budget
+    ), linesep="")
+    pct.log(" OK" if result['within_budget'] else " OVER BUDGET",
+            Level.DONE if result['within_budget'] else Level.FAILED)
+    for name in imported:
+        pct.log("Module %s is imported eagerly." % name, Level.WARNING)
+    return result
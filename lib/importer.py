@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+
+Tobii / OpenSesame recordings import for **--import**. Each subject comes as
+an OpenSesame log, *subject-<name>.csv*, one row per experiment, and a Tobii
+gaze export, *tobii...<name>...csv*. Gaze exports are streamed by chunks:
+their TrueTime clock is forward-filled and samples are assigned to experiments
+with vectorized operations, so that memory use does not grow with the
+recording length.
+"""
+
+import re
+import csv
+import time
+import datetime
+
+import numpy as np
+
+import lib as pct
+from lib import Level
+from .model import ResourceCollection
+
+DATETIME_FORMAT = "%m/%d/%y %H:%M:%S"
+TOBII_COLUMNS = ("Timestamp", "TrueTime", "X", "Y")
+
+
+def observations(directory: str) -> list:
+    """
+    Pairs the **directory** OpenSesame logs with their Tobii gaze exports.
+
+    :param directory:   The recordings directory, searched recursively.
+    :type directory:    str
+    :return:            The subject name, OpenSesame and Tobii files paths
+                        dictionnaries, subjects without gaze export being
+                        skipped.
+    :rtype:             list
+    """
+    files = ResourceCollection(directory, ".csv")
+    retval = list()
+    for opensesame in files.find("^subject"):
+        name = opensesame.rsplit(".", 1)[0].split("-", 1)[-1]
+        tobii = files.find("^tobii.*%s(?![0-9])" % re.escape(name))
+        if not tobii:
+            pct.log("No Tobii export found for %s, skipped." % opensesame,
+                    Level.WARNING)
+            continue
+        retval.append({
+            # Re-downloaded exports are suffixed, e.g "C1 (2)"
+            'name': re.sub(r"\s*\(\d+\)$", "", name),
+            'opensesame': files.get(opensesame),
+            'tobii': files.get(tobii[0])
+        })
+    return retval
+
+
+def read_experiments(opensesame_file: str) -> list:
+    """
+    Reads the experiments of an OpenSesame log, whose windows all start with
+    the recording and end **time_fixation_testing** milliseconds later.
+
+    :param opensesame_file: The OpenSesame log path.
+    :type opensesame_file:  str
+    :return:                The experiments name and end time (in seconds
+                            since the epoch) dictionnaries, in log order.
+    :rtype:                 list
+    """
+    with open(opensesame_file, "r", encoding="utf-8-sig", newline="") as fin:
+        if fin.readline().strip() != "sep=,":
+            fin.seek(0)
+        rows = list(csv.DictReader(fin, delimiter=","))
+    if not rows:
+        return list()
+
+    start = time.mktime(datetime.datetime.strptime(
+        rows[0]["datetime"], DATETIME_FORMAT
+    ).timetuple())
+    return [{
+        'name': "_".join(row[column].split(".")[0] for column in
+                         ("TargetObject", "Active1", "Active2")),
+        'end': start + float(row["time_fixation_testing"]) / 1000
+    } for row in rows]
+
+
+def read_gaze(tobii_file: str, chunk_size: int = None) -> iter:
+    """
+    Streams a Tobii gaze export, **chunk_size** rows at a time. The export
+    last row is dropped, being an incomplete record.
+
+    Samples time is the last TrueTime seen, plus the Timestamp elapsed since
+    its row, in seconds. The anchor is forward-filled within each chunk and
+    carried over to the next one; samples preceding the first TrueTime have
+    no time.
+
+    :param tobii_file:  The Tobii export path.
+    :param chunk_size:  The number of rows read at once, default to the
+                        *import_chunk_size* setting.
+    :type tobii_file:   str
+    :type chunk_size:   int
+    :return:            (time, x, y) float64 arrays tuples.
+    :rtype:             iter
+    """
+    import pandas as pd
+
+    chunk_size = pct.SETTINGS.get("import_chunk_size", 100000) \
+        if chunk_size is None else chunk_size
+    reader = pd.read_csv(
+        tobii_file, usecols=TOBII_COLUMNS, chunksize=chunk_size,
+        dtype={column: np.float64 for column in TOBII_COLUMNS},
+        float_precision="round_trip"
+    )
+
+    anchor = (np.nan, np.nan)
+    previous = None
+    for chunk in reader:
+        if previous is not None:
+            values, anchor = _real_time(previous, anchor)
+            yield values
+        previous = chunk
+    if previous is not None and len(previous) > 1:
+        yield _real_time(previous.iloc[:-1], anchor)[0]
+
+
+def _real_time(chunk, anchor: tuple) -> tuple and tuple:
+    """
+    Computes a gaze **chunk** samples time from the (TrueTime, Timestamp)
+    **anchor** of the previous chunks, and returns it with the chunk last
+    anchor.
+    """
+    timestamp = chunk["Timestamp"].to_numpy()
+    true_time = chunk["TrueTime"].to_numpy()
+
+    rows = np.where(np.isnan(true_time), -1, np.arange(len(true_time)))
+    rows = np.maximum.accumulate(rows)
+    carried = rows < 0
+    anchor_true_time = np.where(carried, anchor[0], true_time[rows])
+    anchor_timestamp = np.where(carried, anchor[1], timestamp[rows])
+
+    real_time = (anchor_true_time + timestamp - anchor_timestamp) / 1000
+    if len(rows):
+        anchor = (anchor_true_time[-1], anchor_timestamp[-1])
+    return (real_time, chunk["X"].to_numpy(), chunk["Y"].to_numpy()), anchor
+
+
+def import_subject(repository, name: str, opensesame_file: str,
+                   tobii_file: str, chunk_size: int = None) -> dict:
+    """
+    Imports a subject experiments and gaze samples. Every experiment gets
+    the samples recorded after the previous experiments ends, up to its own
+    end; samples without time or coordinates, and those recorded after the
+    last experiment, are skipped. The subject is created if unknown.
+
+    Samples are written as each gaze chunk is read or, when the
+    *sample_storage* setting is "blob", as soon as gaze chunks move past
+    their experiment, so that at most one experiment is kept in memory.
+    Nothing is committed if a long transaction is running.
+
+    :param repository:      The destination repository.
+    :param name:            The subject name.
+    :param opensesame_file: The subject OpenSesame log path.
+    :param tobii_file:      The subject Tobii export path.
+    :param chunk_size:      The number of gaze rows read at once.
+    :type repository:       Repository
+    :type name:             str
+    :type opensesame_file:  str
+    :type tobii_file:       str
+    :type chunk_size:       int
+    :return:                The numbers of imported experiments, imported
+                            samples and skipped samples.
+    :rtype:                 dict
+    """
+    blob = pct.SETTINGS.get("sample_storage", "rows") == "blob"
+    experiments = read_experiments(opensesame_file)
+
+    subjects = repository.read({'name': name}, "subjects")
+    subject = subjects[0]["id"] if subjects \
+        else repository.create({'name': name}, "subjects")
+    ids = [repository.create({'subject': subject, 'name': experiment["name"]},
+                             "experiments") for experiment in experiments]
+
+    # Experiment i ends at the first window end reaching its own
+    ends = np.maximum.accumulate(
+        np.array([experiment["end"] for experiment in experiments])
+    )
+    counts = np.zeros(len(ids), dtype=np.int64)
+    first = np.full(len(ids), np.inf)
+    last = np.full(len(ids), -np.inf)
+    pending = [list() for _ in ids]
+    written = np.zeros(len(ids), dtype=bool)
+    skipped = 0
+
+    for real_time, x, y in read_gaze(tobii_file, chunk_size):
+        windows = np.searchsorted(ends, real_time, side="left")
+        valid = (windows < len(ids)) & ~np.isnan(real_time) \
+            & ~np.isnan(x) & ~np.isnan(y)
+        skipped += len(valid) - int(valid.sum())
+
+        order = np.argsort(windows[valid], kind="stable")
+        windows = windows[valid][order]
+        real_time, x, y = (column[valid][order]
+                           for column in (real_time, x, y))
+        starts = np.flatnonzero(np.r_[True, windows[1:] != windows[:-1]]) \
+            if len(windows) else np.empty(0, dtype=np.int64)
+
+        for start, end in zip(starts, np.r_[starts[1:], len(windows)]):
+            index = windows[start]
+            columns = (real_time[start:end], x[start:end], y[start:end])
+            counts[index] += end - start
+            first[index] = min(first[index], columns[0].min())
+            last[index] = max(last[index], columns[0].max())
+            if blob:
+                pending[index].append(columns)
+                continue
+            repository.create_many({
+                'experiment': np.full(end - start, ids[index]),
+                'timestamp': columns[0],
+                'x': columns[1],
+                'y': columns[2]
+            }, "data")
+
+        # Later chunks hardly ever go back to the experiments they passed
+        if blob and len(windows):
+            for index in range(windows[0]):
+                if pending[index]:
+                    _write_samples(repository, ids[index], pending[index],
+                                   written[index])
+                    pending[index], written[index] = list(), True
+
+    for index, id_ in enumerate(ids):
+        if blob and pending[index]:
+            _write_samples(repository, id_, pending[index], written[index])
+        if counts[index] < 2:
+            continue
+        length = (last[index] - first[index]) / 10  # /10 is temporary
+        if length > 0:
+            repository.update({
+                'sample_rate': float(counts[index] / length),
+                'lasted': float(length)
+            }, {'id': id_}, "experiments", False)
+
+    return {
+        'experiments': len(ids),
+        'samples': int(counts.sum()),
+        'skipped': skipped
+    }
+
+
+def _write_samples(repository, experiment: int, pending: list,
+                   merge: bool) -> None:
+    """
+    Stores the **pending** (time, x, y) arrays tuples of an **experiment**,
+    along with its previously written samples if **merge** is set.
+    """
+    columns = [np.concatenate(column) for column in zip(*pending)]
+    if merge:
+        stored = repository.read_samples(experiment)
+        columns = [np.concatenate((stored[name], column)) for name, column
+                   in zip(("timestamp", "x", "y"), columns)]
+    repository.write_samples(experiment, *columns)
+
+
+def import_directory(repository, directory: str,
+                     chunk_size: int = None) -> list:
+    """
+    Imports every subject recordings of **directory** within a single
+    transaction, rolled back as a whole if any subject fails.
+
+    :param repository:  The destination repository.
+    :param directory:   The recordings directory.
+    :param chunk_size:  The number of gaze rows read at once.
+    :type repository:   Repository
+    :type directory:    str
+    :type chunk_size:   int
+    :return:            The subjects names, files and import_subject counts.
+    :rtype:             list
+    """
+    results = list()
+    repository.start_transaction()
+    try:
+        for observation in observations(directory):
+            pct.log("Importing subject %s..." % observation["name"],
+                    Level.INFORMATION, linesep="")
+            observation.update(import_subject(
+                repository, observation["name"], observation["opensesame"],
+                observation["tobii"], chunk_size
+            ))
+            results.append(observation)
+            pct.log(" Done", Level.DONE)
+    except Exception:
+        repository.abort_transaction()
+        raise
+    repository.end_transaction()
+    return results
@@ -7,7 +7,7 @@ Part of the **Pyception** package.
 :Authors: - Florian Indot
 :Contact: florian.indot@gmail.com
 :Date: 23.07.2017
-:Revision: 1
+:Revision: 2
 :Copyright: MIT License
 """
 
@@ -20,20 +20,59 @@ class DBObject(object):
     of this class method and properties. This class thus describes table
     independant logic and behaviours (e.g id, async loading, ...).
 
+    Objects are registered in their repository identity map: a record is
+    mapped to a single object, whose columns are loaded at most once, on
+    first access. **from_records** and **load_many** hydrate whole
+    collections at once.
+
     :seealso: DBFactory
     """
 # ------------------------------------------------------------------- VARIABLES
 
+    _table = None
+    _attributes = list()
+    _repository = None
+    load_chunk_size = 500
+
 # ----------------------------------------------------------------------- MAGIC
 
-    def __init__(self, table: str) -> None:
-        self._table = table
-        self._loaded = False
+    def __new__(cls, id: int) -> "DBObject":
+        key = (cls._table, id)
+        instance = cls._repository.identities.get(key)
+        if instance is None:
+            instance = object.__new__(cls)
+            object.__setattr__(instance, "_id", id)
+            object.__setattr__(instance, "_loaded", False)
+            instance = cls._repository.identities.add(key, instance)
+        return instance
+
+    def __init__(self, id: int) -> None:
+        pass
+
+    def __getattribute__(self, attr) -> object:
+        if attr != "id" and attr in type(self)._attributes \
+                and not object.__getattribute__(self, '_loaded'):
+            object.__getattribute__(self, '_load')()
+        return object.__getattribute__(self, attr)
 
 # --------------------------------------------------------------------- METHODS
 
-    def _async__init__(self, **kwargs) -> None:
-        for key, value in kwargs.items():
+    @classmethod
+    def _links(cls) -> dict:
+        """
+        The foreign key column / referenced column dictionnary of this class
+        table, resolved once per hydrated batch.
+        """
+        return dict(cls._repository.schema.foreign_keys(cls._table))
+
+    def _hydrate(self, record: dict, links: dict = None) -> None:
+        """
+        Sets this object columns from its table **record**. Foreign key
+        columns, given by **links** (see **_links**), are mapped to their
+        (lazy) record object.
+        """
+        links = self._links() if links is None else links
+        for key, value in record.items():
 
             if key == "id":
                 continue
@@ -43,38 +82,64 @@ class DBObject(object):
                     key, self.__class__.__name__)
                 )
 
-            if self._check_links(key):
-                print(key)
-                cls = self._repository.safe.table_class(key)
-                print(cls)
-                object.__setattr__(
-                    self, key, self._repository.safe.table_class(key)(value)
-                )
-                continue
+            if key in links and value is not None:
+                value = self._repository.safe.table_class(key)(value)
 
             object.__setattr__(self, key, value)
+        object.__setattr__(self, "_loaded", True)
+
+    def _load(self) -> None:
+        records = self._repository.read({'id': self._id}, self._table)
+        if not records:
+            raise KeyError("No %s record with id %s" % (
+                self._table, self._id
+            ))
+        self._hydrate(records[0])
+
+    @classmethod
+    def from_records(cls, records: list, links: dict = None) -> list:
+        """
+        Maps table records to objects, hydrating those not loaded yet.
+
+        :param records: The table records, as returned by Repository.read.
+        :param links:   The table foreign keys, see **_links**, resolved on
+                        first hydration if omitted.
+        :type records:  list
+        :type links:    dict
+        :return:        The objects, in **records** order.
+        :rtype:         list
+        """
+        retval = list()
+        for record in records:
+            instance = cls(record["id"])
+            if not object.__getattribute__(instance, "_loaded"):
+                links = cls._links() if links is None else links
+                instance._hydrate(record, links)
+            retval.append(instance)
+        return retval
+
+    @classmethod
+    def load_many(cls, ids: list) -> list:
+        """
+        Maps ids to objects, those not loaded yet being hydrated by a single
+        query per **load_chunk_size** ids.
 
-    def _check_links(self, key: str) -> bool:
-        fks = self._repository.schema.foreign_keys(self._table)
-        for fk in fks:
-            if fk[0] == key:
-                return True
-        return False
-
-    def _load(self):
-        self._loaded = True
-        self._async__init__(
-            **self._repository.read({'id': self._id}, self._table)[0]
-        )
-
-    def __getattribute__(self, attr) -> object:
-        if not object.__getattribute__(self, '_loaded'):
-            object.__getattribute__(self, '_async__init__')(
-                **object.__getattribute__(self, '_repository').read({
-                    'id': self._id
-                }, self._table)[0]
-            )
-        return object.__getattribute__(self, attr)
+        :param ids: The records ids.
+        :type ids:  list
+        :return:    The objects, in **ids** order.
+        :rtype:     list
+        """
+        retval = [cls(id_) for id_ in ids]
+        pending = sorted(set(
+            instance.id for instance in retval
+            if not object.__getattribute__(instance, "_loaded")
+        ))
+        links = cls._links() if pending else None
+        for start in range(0, len(pending), cls.load_chunk_size):
+            cls.from_records(cls._repository.read({
+                'id': pending[start:start + cls.load_chunk_size]
+            }, cls._table), links)
+        return retval
 
     def update(self) -> None:
         """
@@ -82,8 +147,12 @@ class DBObject(object):
         """
         new_values = dict()
         for key in self._attributes:
-            new_values[key] = getattr(self, key)
-        self.repository.update({'id': self._id}, new_values, self._table)
+            if key == "id":
+                continue
+            value = getattr(self, key)
+            new_values[key] = value.id if isinstance(value, DBObject) \
+                else value
+        self._repository.update(new_values, {'id': self._id}, self._table)
 
 # ------------------------------------------------------------------ PROPERTIES
 
@@ -107,11 +176,8 @@ def DBFactory(table: str, repo, attrs: list) -> type:
     :return:            The new type
     :rtype:             type
     """
-    def __init__(self, id):
-        setattr(self, "_id", id)
-        DBObject.__init__(self, table)
-
-    new_class = type(table, (DBObject,), {'__init__': __init__})
+    new_class = type(table, (DBObject,), dict())
+    new_class._table = table
     new_class._attributes = attrs
     new_class._repository = repo
 
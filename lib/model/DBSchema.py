@@ -14,7 +14,6 @@ Part of the **PyCeption** package.
 
 import sqlite3
 from collections import OrderedDict
-import re
 from .Graph import Graph
 
 
@@ -35,66 +34,85 @@ class DBSchema(object):
     valuable information regarding the actual database scheme. Uses a
     non-directionnal graph.
 
+    Tables, columns and foreign keys are read once through PRAGMA queries,
+    and join plans are compiled once per (table, link) pair. Everything is
+    reloaded by **check** when the database schema_version changed.
+
     :seealso: Repository
     """
 
 # ------------------------------------------------------------------- VARIABLES
 
-    _schema_query = "SELECT sql FROM sqlite_master WHERE type='table';"
+    _tables_query = "SELECT name FROM sqlite_master WHERE type='table' " \
+                    "AND name NOT LIKE 'sqlite_%' ORDER BY name;"
 
 # ----------------------------------------------------------------------- MAGIC
 
-    def __init__(self, db_conn: sqlite3.Connection) -> None:
+    def __init__(self, repository) -> None:
         """
         Class constructor. Intializes internal values.
 
-        :param db_conn: The targeted sqlite3 connection.
-        :type db_conn:  sqlite3.Connection
+        :param repository:  The inspected database repository, whose calling
+                            thread connection is used for every query.
+        :type repository:   Repository
         """
-        self.db_conn = db_conn
-        self._graph = Graph(direction=False)
-        self._foreign_keys = dict()
-
-        cursor = db_conn.execute(self._schema_query)
-        schemas = [dict(cell)["sql"] for cell in cursor.fetchall()]
-        for schema in schemas:
-            self._analyze_schema(schema)
+        self._repository = repository
+        self._version = None
+        self.refresh()
 
 # --------------------------------------------------------------------- METHODS
 
-    def _analyze_schema(self, schema: str) -> None:
+    def refresh(self) -> None:
         """
-        Analyse a given table construction query as pulled from the sqlite3
-        master table and append retrieved values to the internal graph.
-
-        :param schema:  The analyzed schema.
-        :type schema:   str
+        (Re)loads the database tables, columns and foreign keys and drops the
+        compiled join plans.
         """
-        schema_lines = schema.splitlines()
+        self._version = self.version
+        self._graph = Graph(direction=False)
+        self._tables = list()
+        self._columns = dict()
+        self._foreign_keys = dict()
+        self._plans = dict()
 
-        re_groups = re.match(
-            ".*CREATE TABLE (.*)", schema_lines[0]
-        ).groups()
-        name = re_groups[0].strip(" ()\´`")
-        self._graph.add(name)
-        schema_lines.pop(0)
+        for (table,) in self.db_conn.execute(self._tables_query).fetchall():
+            self._analyze_table(table)
 
-        for line in schema_lines:
-            regex = re.match(
-                ".*FOREIGN KEY \((.*)\) REFERENCES (.*) \((.*)\).*", line
-            )
+    def check(self) -> bool:
+        """
+        Reloads the schema if it changed since it was last read, from any
+        connection or process. Accessors do not check by themselves: the
+        Repository checks once per read, and refreshes the schema after its
+        own schema changes.
 
-            if not regex:
-                continue
-            results = regex.groups()
-            results = [result.strip(" ()\´`") for result in results]
+        :return:    Whether the schema was reloaded.
+        :rtype:     bool
+        """
+        if self.version == self._version:
+            return False
+        self.refresh()
+        return True
 
-            self._graph.add(results[1])
-            self._graph.connect(name, results[1])
+    def _analyze_table(self, table: str) -> None:
+        """
+        Reads a table columns and foreign keys and appends them to the
+        internal graph.
 
-            self._foreign_keys[(name, results[1])] = (
-                results[0], results[2]
-            )
+        :param table:   The analyzed table.
+        :type table:    str
+        """
+        self._tables.append(table)
+        self._graph.add(table)
+        self._columns[table] = [
+            row[1] for row in self.db_conn.execute(
+                "PRAGMA table_info({0});".format(table)
+            ).fetchall()
+        ]
+        # id, seq, table, from, to, on_update, on_delete, match
+        for row in self.db_conn.execute(
+                "PRAGMA foreign_key_list({0});".format(table)).fetchall():
+            self._graph.add(row[2])
+            self._graph.connect(table, row[2])
+            self._foreign_keys[(table, row[2])] = (row[3], row[4])
 
     def path(self, table_one: str, table_two: str) -> dict:
         """
@@ -124,6 +142,32 @@ class DBSchema(object):
             )
         return retval
 
+    def join(self, table: str, link: str) -> str:
+        """
+        The compiled INNER JOIN clauses connecting **link** to **table**, as
+        used by **Repository.read**. Plans are computed once per pair.
+
+        :param table:   The filtered table.
+        :param link:    The selected table.
+        :type table:    str
+        :type link:     str
+        :return:        The JOIN clauses, None when the tables are not
+                        connected.
+        :rtype:         str
+        """
+        if (table, link) not in self._plans:
+            path = self.path(table, link)
+            plan = None
+            if path:
+                plan = ""
+                for milestone in list(reversed(path.keys())):
+                    plan += " INNER JOIN {0} ON {1}.{2}={3}.{4}".format(
+                        milestone[0], milestone[0], path[milestone][0],
+                        milestone[1], path[milestone][1]
+                    )
+            self._plans[(table, link)] = plan
+        return self._plans[(table, link)]
+
     def link(self, table_one: str, table_two: str) -> tuple:
         """
         Finds the **direct** (distance=1) relation between two tables and
@@ -154,8 +198,9 @@ class DBSchema(object):
         :return:        The list of names
         :rtype:         list
         """
-        cursor = self.db_conn.execute("SELECT * FROM {0}".format(table))
-        return [description[0] for description in cursor.description]
+        if table not in self._columns:
+            raise IndexError("Table %s not present in database" % table)
+        return list(self._columns[table])
 
     def foreign_keys(self, table: str) -> list:
         if table not in self.tables:
@@ -170,10 +215,20 @@ class DBSchema(object):
 
 # ------------------------------------------------------------------ PROPERTIES
 
+    @property
+    def db_conn(self) -> sqlite3.Connection:
+        """
+        The repository connection of the calling thread.
+        """
+        return self._repository.db_conn
+
     @property
     def tables(self) -> list:
-        cursor = self.db_conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table';"
-        )
+        return list(self._tables)
 
-        return [item for sublist in cursor.fetchall() for item in sublist]
+    @property
+    def version(self) -> int:
+        """
+        The database schema_version, bumped by sqlite on every schema change.
+        """
+        return self.db_conn.execute("PRAGMA schema_version;").fetchone()[0]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class IdentityMap(object):
+    """
+    Bounded (table, id) / object dictionnary ensuring a record is mapped to
+    a single object. The least recently used objects are forgotten beyond
+    **size** entries; they remain valid, a later lookup simply builds a new
+    object.
+
+    :seealso: DBObject
+    """
+# ----------------------------------------------------------------------- MAGIC
+
+    def __init__(self, size: int = 10000) -> None:
+        """
+        Class constructor.
+
+        :param size:    The maximum number of mapped objects.
+        :type size:     int
+        """
+        self.size = size
+        self._objects = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._objects
+
+# --------------------------------------------------------------------- METHODS
+
+    def get(self, key: tuple) -> object:
+        """
+        Returns the object mapped to **key**, None if none.
+
+        :param key: The (table, id) tuple.
+        :type key:  tuple
+        :return:    The mapped object.
+        :rtype:     object
+        """
+        with self._lock:
+            instance = self._objects.get(key)
+            if instance is not None:
+                self._objects.move_to_end(key)
+            return instance
+
+    def add(self, key: tuple, instance: object) -> object:
+        """
+        Maps **instance** to **key**, unless an object already is.
+
+        :param key:         The (table, id) tuple.
+        :param instance:    The object.
+        :type key:          tuple
+        :type instance:     object
+        :return:            The object mapped to **key**.
+        :rtype:             object
+        """
+        with self._lock:
+            instance = self._objects.setdefault(key, instance)
+            self._objects.move_to_end(key)
+            while len(self._objects) > self.size:
+                self._objects.popitem(last=False)
+            return instance
+
+    def clear(self) -> None:
+        """
+        Forgets every mapped object.
+        """
+        with self._lock:
+            self._objects.clear()
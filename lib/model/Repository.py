@@ -17,12 +17,21 @@ from lib import Level
 from .ResourceCollection import ResourceCollection as RC
 from .DBSchema import DBSchema
 from .Safe import Safe
+from .IdentityMap import IdentityMap
+from . import samples
 
-from os.path import dirname, join, abspath
+from os.path import basename, dirname, join, abspath
+from urllib.request import pathname2url
 
 import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import chain, islice
 from overload import overload
 
+import numpy as np
+
 
 class RepositoryException(Exception):
     pass
@@ -36,46 +45,153 @@ class Repository(object):
     To avoid expensive I/O operations, this class delays sql commits for an
     arbitrary amount of queries. This arbitrary amount can be changed through
     **Repository.commit_delay**.
+
+    Values are always bound as query parameters. The SQL text of every query
+    shape (operation, table, constrained columns, link) is built once and
+    cached, **statistics** counting the cache hits and misses along with
+    the executed statements.
+
+    Each thread gets its own connection, configured by the **profile**
+    PRAGMAs (see the *db_profiles* setting), so that one Repository can be
+    shared by concurrent readers and a writer. Transactions belong to the
+    thread which started them.
+
+    A constraint value given as a list (or tuple) matches any of its values,
+    e.g `read({'experiment': [1, 2, 3]}, "data")`.
+
+    Records of the tables listed in **ordering** are read in that order,
+    which the indexes created by the migrations serve directly.
     """
 # ------------------------------------------------------------------- VARIABLES
 
-    db_conn = None
-
-    _transaction_count = 0
     commit_delay = 50
+    statement_cache_size = 256
+    _shared = dict()
+    _shared_lock = threading.Lock()
+    bulk_chunk_size = 10000
+    fetch_chunk_size = 10000
+    identity_map_size = 10000
+    sample_chunk_size = 65536
+    ordering = {"data": "timestamp"}
 
 # ----------------------------------------------------------------------- MAGIC
 
     def __init__(self, db_file: str, schema_dir: str = join(
-        dirname(abspath(__file__)), "sql")
+        dirname(abspath(__file__)), "sql"), migration_dir: str = join(
+        dirname(abspath(__file__)), "migrations"), profile: str = None,
+        read_only: bool = False
     ) -> None:
         """
         Initializes the database connection and the sql schema directory.
 
-        :param db_file:     The database file path.
-        :type db_file:      str
-        :param schema_dir:  The tables schema directory.
-        :type schema_dir:   str
+        :param db_file:         The database file path.
+        :type db_file:          str
+        :param schema_dir:      The tables schema directory.
+        :type schema_dir:       str
+        :param migration_dir:   The NNNN_name.sql migrations directory.
+        :type migration_dir:    str
+        :param profile:         The connection profile, one of the
+                                *db_profiles* setting keys, default to the
+                                *db_profile* setting.
+        :type profile:          str
+        :param read_only:       Whether to open the database read-only,
+                                leaving the file untouched.
+        :type read_only:        bool
         """
         self.db_file = db_file
-        self.db_conn = sqlite3.connect(db_file)
-        self.db_conn.row_factory = sqlite3.Row
+        self.read_only = read_only
+        self.profile = pct.SETTINGS.get("db_profile") if profile is None \
+            else profile
+        profiles = pct.SETTINGS.get("db_profiles", dict())
+        if self.profile is not None and self.profile not in profiles:
+            raise RepositoryException("Unknown database profile %s" %
+                                      self.profile)
+        self.pragmas = profiles.get(self.profile, dict())
+
+        self._local = threading.local()
+        self._connections = list()
+        self._lock = threading.Lock()
+
+        self._statements = OrderedDict()
+        self._statements_lock = threading.Lock()
+        self.statistics = {'hits': 0, 'misses': 0, 'executions': 0}
 
         self.schemas = RC(schema_dir, [".sql"])
-        self.schema = DBSchema(self.db_conn)
+        self.migrations = RC(migration_dir, [".sql"])
+        self.schema = DBSchema(self)
+        self.identities = IdentityMap(self.identity_map_size)
         self.safe = Safe(self)
 
-        self.long_transaction = False
-
     def __del__(self) -> None:
         """
-        Class destructor. Commits remaining queries and close the connection.
+        Class destructor. Commits remaining queries and close the connections.
         """
-        self.db_conn.commit()
-        self.db_conn.close()
+        if "_connections" in self.__dict__:
+            self.close()
 
 # --------------------------------------------------------------------- METHODS
 
+    @classmethod
+    def shared(cls, db_file: str, profile: str = None) -> "Repository":
+        """
+        Returns the Repository of **db_file** shared process wide, creating
+        it on first request. Its per thread connections make it safe to use
+        from any thread.
+
+        :param db_file: The database file path.
+        :param profile: The connection profile, see the constructor.
+        :type db_file:  str
+        :type profile:  str
+        :return:        The shared instance.
+        :rtype:         Repository
+        """
+        key = (abspath(db_file), profile)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(db_file, profile=profile)
+            return cls._shared[key]
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens a connection to the database and applies the profile PRAGMAs.
+        Read-only connections skip journal_mode, which is stored in the
+        database file.
+        """
+        if self.read_only:
+            connection = sqlite3.connect(
+                "file:{0}?mode=ro".format(pathname2url(abspath(self.db_file))),
+                cached_statements=self.statement_cache_size,
+                check_same_thread=False, uri=True
+            )
+        else:
+            connection = sqlite3.connect(
+                self.db_file, cached_statements=self.statement_cache_size,
+                check_same_thread=False
+            )
+        connection.row_factory = sqlite3.Row
+        for pragma, value in self.pragmas.items():
+            if self.read_only and pragma == "journal_mode":
+                continue
+            connection.execute("PRAGMA {0} = {1};".format(pragma, value))
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        """
+        Commits remaining queries and closes every thread connection.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, list()
+        for connection in connections:
+            try:
+                connection.commit()
+                connection.close()
+            except sqlite3.Error as e:
+                pct.log("Unable to close %s: %s" % (self.db_file, e),
+                        Level.WARNING)
+        self._local = threading.local()
+
     def initialize(self) -> None:
         """
         Sets up the database schemas as specified in the schema_dir sql files.
@@ -89,8 +205,49 @@ class Repository(object):
                 pct.log(query, Level.DEBUG)
                 self.db_conn.execute(query)
         self.db_conn.commit()
+        self.migrate()
         pct.log("Database initialized.", Level.INFORMATION)
 
+    def migrate(self) -> int:
+        """
+        Applies, in order, the migration_dir NNNN_name.sql scripts the
+        database has not seen yet. The last applied migration number is
+        stored in the database user_version pragma; each migration is applied
+        along with its version bump in a single transaction.
+
+        :return:    The database version.
+        :rtype:     int
+        """
+        version = self.version
+        pending = sorted(
+            (int(basename(fin).split("_")[0]), fin)
+            for fin in self.migrations.list()
+        )
+        for number, fin in pending:
+            if number <= version:
+                continue
+            pct.log("Applying migration %s..." % basename(fin),
+                    Level.INFORMATION, linesep="")
+            with open(fin, "r") as migration:
+                script = migration.read()
+            self.db_conn.commit()
+            try:
+                self.db_conn.executescript(
+                    "BEGIN;\n{0}\nPRAGMA user_version = {1:d};\nCOMMIT;"
+                    .format(script, number)
+                )
+            except sqlite3.Error:
+                pct.log(" Failed", Level.FAILED)
+                if self.db_conn.in_transaction:
+                    self.db_conn.rollback()
+                raise
+            pct.log(" Done", Level.DONE)
+            version = number
+        self.schema.refresh()
+        with self._statements_lock:
+            self._statements.clear()
+        return version
+
     def drop(self, table: str = "") -> None:
         """
         Drop the table :table: and every records it contains.
@@ -101,11 +258,101 @@ class Repository(object):
         .. warning:: The database content will be lost forever.
         """
         if table == "":
-            for table in self.tables:
+            for table in self.schema.tables:
                 self.db_conn.execute("DROP TABLE {0};".format(table))
         else:
             self.db_conn.execute("DROP TABLE {0};".format(table))
         self.db_conn.commit()
+        self.schema.refresh()
+        with self._statements_lock:
+            self._statements.clear()
+
+    def _statement(self, key: tuple, build: callable) -> str:
+        """
+        Returns the SQL text cached under **key**, building it through
+        **build** on the first request. Queries of the same shape thus share
+        the same SQL text, which also lets sqlite3 reuse its prepared
+        statement.
+
+        Only the **statement_cache_size** most recently used shapes are
+        kept: each IN list length is a shape of its own.
+
+        :param key:     The query shape, e.g ("read", table, keys, link).
+        :param build:   Builds the SQL text.
+        :type key:      tuple
+        :type build:    callable
+        :return:        The SQL text.
+        :rtype:         str
+        """
+        with self._statements_lock:
+            query = self._statements.get(key)
+            if query is not None:
+                self._statements.move_to_end(key)
+                self.statistics['hits'] += 1
+                return query
+            self.statistics['misses'] += 1
+
+        query = build()
+        with self._statements_lock:
+            self._statements[key] = query
+            while len(self._statements) > self.statement_cache_size:
+                self._statements.popitem(last=False)
+        return query
+
+    def _count_execution(self) -> None:
+        """
+        Increments the executed statements count, from any thread.
+        """
+        with self._statements_lock:
+            self.statistics['executions'] += 1
+
+    def _execute(self, query: str, parameters: list = ()) -> sqlite3.Cursor:
+        """
+        Executes **query** with the **parameters** bound values.
+        """
+        self._count_execution()
+        pct.log("Executing query : %s" % query, pct.Level.DEBUG)
+        return self.db_conn.execute(query, parameters)
+
+    @staticmethod
+    def _shape(constraints: dict) -> tuple:
+        """
+        The constrained columns, as (column, count) tuples for the columns
+        matched against a list of values.
+        """
+        return tuple(
+            (key, len(value)) if isinstance(value, (list, tuple)) else key
+            for key, value in constraints.items()
+        )
+
+    @staticmethod
+    def _parameters(constraints: dict) -> list:
+        """
+        The **constraints** values to bind, lists of values being flattened.
+        """
+        parameters = list()
+        for value in constraints.values():
+            if isinstance(value, (list, tuple)):
+                parameters.extend(value)
+            else:
+                parameters.append(value)
+        return parameters
+
+    @staticmethod
+    def _where(keys: tuple, table: str = None) -> str:
+        """
+        Builds the WHERE clause matching every **keys** column against a bound
+        value, or a list of bound values for (column, count) tuples, or an
+        empty string when there is no key.
+        """
+        if not keys:
+            return ""
+        prefix = "" if table is None else table + "."
+        return " WHERE " + " AND ".join(
+            "{0}{1} IN ({2})".format(prefix, key[0], ", ".join("?" * key[1]))
+            if isinstance(key, tuple) else "{0}{1}=?".format(prefix, key)
+            for key in keys
+        )
 
     @overload
     def create(self, values: dict, table: str) -> int:
@@ -122,24 +369,14 @@ class Repository(object):
         :return:        The newly inserted row id (primary key)
         :rtype:         int
         """
-        query_labels = ""
-        query_keys = ""
-        query_values = list()
-        cpt = 0
-        for key in values:
-            if cpt > 0 and cpt < len(values):
-                query_labels += ", "
-                query_keys += ", "
-            query_labels += key
-            query_keys += "?"
-            query_values.append(values[key])
-            cpt += 1
-
-        query = "INSERT INTO {0} ({1}) VALUES ({2});".format(
-            table, query_labels, query_keys
+        keys = tuple(values.keys())
+        query = self._statement(
+            ("create", table, keys),
+            lambda: "INSERT INTO {0} ({1}) VALUES ({2});".format(
+                table, ", ".join(keys), ", ".join("?" for _ in keys)
+            )
         )
-
-        cursor = self.db_conn.execute(query, query_values)
+        cursor = self._execute(query, list(values.values()))
 
         self._commit()
         return cursor.lastrowid
@@ -155,10 +392,131 @@ class Repository(object):
         :return:        The last inserted row id (primary key)
         :rtype:         int
         """
-        lastrowid = -1
-        for row in array:
-            lastrowid = self.create(row, table)
-        return lastrowid
+        return self.create_many(array, table)
+
+    def create_many(self, rows: list or dict, table: str,
+                    chunk_size: int = None,
+                    id_range: bool = False) -> int or tuple:
+        """
+        Bulk inserts **rows** in the **table** table, by chunks of
+        **chunk_size** rows sent through a single executemany each. Every
+        chunk is inserted within the same transaction, committed at the end
+        unless a long transaction has been started. On error, the inserted
+        chunks are rolled back, earlier uncommitted queries being kept.
+
+        **rows** is either an iterable of dictionnaries sharing the columns of
+        the first one, or a column / values dictionnary, values being any
+        sequence (e.g numpy arrays) of the same length.
+
+        Inserted ids are only contiguous when the primary key is not given,
+        which **id_range** relies on.
+
+        :param rows:        The rows, or columns, to insert.
+        :param table:       The targeted table.
+        :param chunk_size:  The number of rows per executemany, default to
+                            **bulk_chunk_size**.
+        :param id_range:    Whether to return the inserted (first, last) ids
+                            instead of the last one.
+        :type rows:         list or dict
+        :type table:        str
+        :type chunk_size:   int
+        :type id_range:     bool
+        :return:            The last inserted row id, -1 if none, or the
+                            (first, last) inserted ids, None if none.
+        :rtype:             int or tuple
+        """
+        chunk_size = self.bulk_chunk_size if chunk_size is None \
+            else chunk_size
+
+        if isinstance(rows, dict):
+            keys = tuple(rows.keys())
+            chunks = self._column_chunks(rows, keys, chunk_size)
+        else:
+            rows = iter(rows)
+            first = next(rows, None)
+            keys = tuple(first.keys()) if first is not None else ()
+            chunks = self._row_chunks(
+                chain((first,), rows), keys, chunk_size
+            ) if first is not None else iter(())
+
+        query = self._statement(
+            ("create", table, keys),
+            lambda: "INSERT INTO {0} ({1}) VALUES ({2});".format(
+                table, ", ".join(keys), ", ".join("?" for _ in keys)
+            )
+        )
+
+        first_id = last_id = None
+        with self._savepoint("create_many"):
+            for chunk in chunks:
+                self._count_execution()
+                self.db_conn.executemany(query, chunk)
+                last_id = self.db_conn.execute(
+                    "SELECT last_insert_rowid();"
+                ).fetchone()[0]
+                if first_id is None:
+                    first_id = last_id - len(chunk) + 1
+
+        if not self.long_transaction:
+            self.db_conn.commit()
+            self._transaction_count = 0
+
+        if id_range:
+            return None if last_id is None else (first_id, last_id)
+        return -1 if last_id is None else last_id
+
+    @contextmanager
+    def _savepoint(self, name: str) -> None:
+        """
+        Runs the enclosed queries within the **name** savepoint: on error,
+        they are rolled back while the queries issued before, still waiting
+        for their delayed commit, are kept.
+        """
+        # Outside a transaction, releasing the savepoint would commit
+        if not self.db_conn.in_transaction:
+            self.db_conn.execute("BEGIN;")
+        self.db_conn.execute("SAVEPOINT {0};".format(name))
+        try:
+            yield
+        except BaseException:
+            # Some errors (e.g disk full) already rolled back everything
+            if self.db_conn.in_transaction:
+                self.db_conn.execute("ROLLBACK TO {0};".format(name))
+                self.db_conn.execute("RELEASE {0};".format(name))
+            raise
+        self.db_conn.execute("RELEASE {0};".format(name))
+
+    @staticmethod
+    def _row_chunks(rows: iter, keys: tuple, chunk_size: int) -> iter:
+        """
+        Yields **rows** dictionnaries as lists of **keys** ordered tuples.
+        """
+        while True:
+            chunk = [tuple(row[key] for key in keys)
+                     for row in islice(rows, chunk_size)]
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def _column_chunks(columns: dict, keys: tuple, chunk_size: int) -> iter:
+        """
+        Yields **columns** values as lists of **keys** ordered tuples.
+        """
+        length = len(columns[keys[0]]) if keys else 0
+        for start in range(0, length, chunk_size):
+            yield list(zip(*(
+                Repository._tolist(columns[key][start:start + chunk_size])
+                for key in keys
+            )))
+
+    @staticmethod
+    def _tolist(values) -> list:
+        """
+        Turns a sequence into a list of python scalars, which sqlite3 knows
+        how to bind (numpy integers are not).
+        """
+        return values.tolist() if hasattr(values, "tolist") else list(values)
 
     def _read_guard(self) -> None:
         """
@@ -191,20 +549,7 @@ class Repository(object):
         """
         self._read_guard()
 
-        query_constraints = ""
-        tgc = "id" if lazy else "*"
-
-        for index, key in enumerate(constraints):
-            if index > 0 and index < len(constraints):
-                query_constraints += " AND "
-            query_constraints += "{0}='{1}'".format(key, constraints[key])
-
-        query = "SELECT {0} FROM {1} WHERE {2};".format(
-            tgc, table, query_constraints
-        )
-
-        pct.log("Executing query : %s" % query, pct.Level.DEBUG)
-        cursor = self.db_conn.execute(query)
+        cursor = self._select(constraints, table, None, lazy)
 
         return [dict(cell) for cell in cursor.fetchall()]
 
@@ -214,8 +559,7 @@ class Repository(object):
         """
         Attemps to find the connection between **table** and **link**
         from the underlying DBSchema before to match the **constraints**
-        dictionnary on **table**. Records from **link** connected to the        tgc = "id" if lazy else "*"
-
+        dictionnary on **table**. Records from **link** connected to the
         found **table** records are then returned.
 
         :param constraints: Key/value dictionnary used to filter the database
@@ -233,37 +577,68 @@ class Repository(object):
         """
         self._read_guard()
 
-        tgc = "id" if lazy else "*"
-        path = self.schema.path(table, link)
-        query_constraints = ""
+        cursor = self._select(constraints, table, link, lazy)
 
-        if not path:
-            raise RepositoryException(
-                "No connection found between {0} and {1}".format(table, link)
-            )
+        return [dict(cell) for cell in cursor.fetchall()]
 
-        for index, key in enumerate(constraints):
-            if index > 0 and index < len(constraints):
-                query_constraints += " AND "
-            query_constraints += "{2}.{0}='{1}'".format(
-                key, constraints[key], table
+    def _select(self, constraints: dict, table: str, link: str = None,
+                lazy: bool = False) -> sqlite3.Cursor:
+        """
+        Executes the SELECT query shared by **read** and **iterate**.
+        """
+        self._check_schema()
+        keys = self._shape(constraints)
+        if link is None:
+            query = self._statement(
+                ("read", table, keys, None, lazy),
+                lambda: "SELECT {0} FROM {1}{2}{3};".format(
+                    "id" if lazy else "*", table, self._where(keys),
+                    self._order(table)
+                )
             )
+        else:
+            query = self._statement(
+                ("read", table, keys, link, lazy),
+                lambda: self._linked_query(keys, table, link, lazy)
+            )
+        return self._execute(query, self._parameters(constraints))
+
+    def _check_schema(self) -> None:
+        """
+        Reloads the schema and drops the cached statements, whose join plans
+        and column lists may be stale, when another connection or process
+        changed the database schema. Costs a single PRAGMA query.
+        """
+        if self.schema.check():
+            with self._statements_lock:
+                self._statements.clear()
 
-        query_join = ""
-        for milestone in list(reversed(path.keys())):
-            query_join += " INNER JOIN {0} ON {1}.{2}={3}.{4}".format(
-                milestone[0], milestone[0], path[milestone][0],
-                milestone[1], path[milestone][1]
+    def _linked_query(self, keys: tuple, table: str, link: str,
+                      lazy: bool) -> str:
+        """
+        Builds the SELECT query of **link** records connected to the
+        **table** records matching **keys**.
+        """
+        query_join = self.schema.join(table, link)
+        if query_join is None:
+            raise RepositoryException(
+                "No connection found between {0} and {1}".format(table, link)
             )
 
-        query = "SELECT {1}.{0} FROM {1}{2} WHERE {3};".format(
-            tgc, link, query_join, query_constraints
+        return "SELECT {1}.{0} FROM {1}{2}{3}{4};".format(
+            "id" if lazy else "*", link, query_join, self._where(keys, table),
+            self._order(link, link)
         )
 
-        pct.log("Executing query : %s" % query, pct.Level.DEBUG)
-        cursor = self.db_conn.execute(query)
-
-        return [dict(cell) for cell in cursor.fetchall()]
+    def _order(self, table: str, prefix: str = None) -> str:
+        """
+        Builds the ORDER BY clause of the **table** default ordering, if any.
+        """
+        if table not in self.ordering:
+            return ""
+        return " ORDER BY {0}{1}".format(
+            "" if prefix is None else prefix + ".", self.ordering[table]
+        )
 
     @read.add
     def read(self, table: str, lazy: bool = False) -> list:
@@ -276,14 +651,286 @@ class Repository(object):
         :return:        A list of dictionnaries, corresponding to the records.
         :rtype:         list
         """
-        tgc = "id" if lazy else "*"
+        return self.read({}, table, lazy)
+
+    def iterate(self, constraints: dict, table: str, link: str = None,
+                lazy: bool = False, chunk_size: int = None,
+                chunks: bool = False) -> iter:
+        """
+        Streaming counterpart of **read**: records are fetched **chunk_size**
+        at a time, so that memory stays bounded whatever the selection size.
+
+        The cursor stays open until the generator is exhausted or closed.
+        Avoid writing to **table** meanwhile.
+
+        :param constraints: Key/value dictionnary used to filter the database
+                            selection. Set to empty {} to pull the whole table
+                            content.
+        :param table:       The (filtered) table name.
+        :param link:        The target data table, see **read**.
+        :param lazy:        Whether to only pull the records ids.
+        :param chunk_size:  The number of records fetched at once, default to
+                            **fetch_chunk_size**.
+        :param chunks:      Whether to yield lists of records rather than
+                            records.
+        :type constraints:  dict
+        :type table:        str
+        :type link:         str
+        :type lazy:         bool
+        :type chunk_size:   int
+        :type chunks:       bool
+        :return:            A generator of dictionnaries, or of lists of
+                            dictionnaries.
+        :rtype:             generator
+        """
         self._read_guard()
 
-        cursor = self.db_conn.execute("SELECT {0} FROM {1};".format(
-            tgc, table
-        ))
+        chunk_size = self.fetch_chunk_size if chunk_size is None \
+            else chunk_size
+        cursor = self._select(constraints, table, link, lazy)
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    return
+                if chunks:
+                    yield [dict(cell) for cell in rows]
+                else:
+                    for cell in rows:
+                        yield dict(cell)
+        finally:
+            cursor.close()
+
+    def read_columns(self, constraints: dict, table: str, columns: tuple,
+                     dtypes: dict = None, order: str = None,
+                     chunk_size: int = None) -> OrderedDict:
+        """
+        Pulls the **columns** columns of the **table** records that meet the
+        **constraints** constraints straight into numpy arrays. Arrays are
+        preallocated from a COUNT query and filled chunk by chunk from plain
+        tuples, no per record dictionnary being built.
 
-        return [dict(cell) for cell in cursor.fetchall()]
+        :param constraints: Key/value dictionnary used to filter the database
+                            selection. Set to empty {} to pull the whole table
+                            content.
+        :param table:       The table name.
+        :param columns:     The projected columns.
+        :param dtypes:      Column / numpy dtype dictionnary, columns missing
+                            from it being read as float64.
+        :param order:       The ORDER BY clause content, e.g "timestamp",
+                            default to the table default ordering.
+        :param chunk_size:  The number of records fetched at once, default to
+                            **fetch_chunk_size**.
+        :type constraints:  dict
+        :type table:        str
+        :type columns:      tuple
+        :type dtypes:       dict
+        :type order:        str
+        :type chunk_size:   int
+        :return:            The column / array ordered dictionnary.
+        :rtype:             OrderedDict
+        """
+        self._read_guard()
+
+        self._check_schema()
+        columns = tuple(columns)
+        dtypes = dict() if dtypes is None else dtypes
+        chunk_size = self.fetch_chunk_size if chunk_size is None \
+            else chunk_size
+        keys = self._shape(constraints)
+        values = self._parameters(constraints)
+
+        length = self.count(constraints, table)
+        retval = OrderedDict(
+            (name, np.empty(length, dtype=dtypes.get(name, np.float64)))
+            for name in columns
+        )
+
+        query = self._statement(
+            ("columns", table, keys, columns, order),
+            lambda: "SELECT {0} FROM {1}{2}{3};".format(
+                ", ".join(columns), table, self._where(keys),
+                self._order(table) if order is None
+                else " ORDER BY {0}".format(order)
+            )
+        )
+        self._count_execution()
+        pct.log("Executing query : %s" % query, pct.Level.DEBUG)
+        cursor = self.db_conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, values)
+
+        position = 0
+        try:
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                if position + len(rows) > length:
+                    raise RepositoryException(
+                        "Table {0} changed while being read".format(table)
+                    )
+                for name, column in zip(columns, zip(*rows)):
+                    retval[name][position:position + len(rows)] = column
+                position += len(rows)
+        finally:
+            cursor.close()
+
+        if position < length:
+            for name in columns:
+                retval[name] = retval[name][:position]
+        return retval
+
+    def write_samples(self, experiment: int, timestamp: np.ndarray,
+                      x: np.ndarray, y: np.ndarray, dtype: str = None,
+                      chunk_size: int = None) -> int:
+        """
+        Stores the **experiment** gaze samples in the compact samples table,
+        replacing those previously stored. Samples are sorted by timestamp,
+        then split into **chunk_size** long chunks, each column chunk being
+        compressed into a BLOB (see the samples module).
+
+        :param experiment:  The experiment id.
+        :param timestamp:   The samples timestamps, stored as float64.
+        :param x:           The samples x coordinates.
+        :param y:           The samples y coordinates.
+        :param dtype:       The coordinates little endian storage dtype, <f8
+                            or the lossy but twice smaller <f4, default to
+                            the *sample_dtype* setting.
+        :param chunk_size:  The number of samples per chunk, default to
+                            **sample_chunk_size**.
+        :type experiment:   int
+        :type timestamp:    np.ndarray
+        :type x:            np.ndarray
+        :type y:            np.ndarray
+        :type dtype:        str
+        :type chunk_size:   int
+        :return:            The number of stored chunks.
+        :rtype:             int
+        """
+        dtype = pct.SETTINGS.get("sample_dtype", "<f8") if dtype is None \
+            else dtype
+        chunk_size = self.sample_chunk_size if chunk_size is None \
+            else chunk_size
+        timestamp = np.asarray(timestamp, dtype=np.float64)
+        x = np.asarray(x)
+        y = np.asarray(y)
+        if not len(timestamp) == len(x) == len(y):
+            raise RepositoryException("Samples columns lengths differ")
+        if len(timestamp) > 1 and np.any(np.diff(timestamp) < 0):
+            order = np.argsort(timestamp, kind="stable")
+            timestamp, x, y = timestamp[order], x[order], y[order]
+
+        rows = list()
+        for chunk, start in enumerate(range(0, len(timestamp), chunk_size)):
+            end = start + chunk_size
+            blobs = (samples.encode(timestamp[start:end],
+                                    samples.TIMESTAMP_DTYPE),
+                     samples.encode(x[start:end], dtype),
+                     samples.encode(y[start:end], dtype))
+            rows.append((experiment, chunk, len(timestamp[start:end]), dtype,
+                         samples.checksum(*blobs)) + blobs)
+
+        with self._savepoint("write_samples"):
+            self._execute("DELETE FROM samples WHERE experiment=?;",
+                          [experiment])
+            self._count_execution()
+            self.db_conn.executemany(
+                "INSERT INTO samples (experiment, chunk, count, dtype, "
+                "checksum, timestamp, x, y) VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
+                rows
+            )
+
+        if not self.long_transaction:
+            self.db_conn.commit()
+            self._transaction_count = 0
+        return len(rows)
+
+    def read_samples(self, experiment: int) -> OrderedDict:
+        """
+        Pulls the **experiment** gaze samples from the compact samples table
+        into preallocated numpy arrays.
+
+        :param experiment:  The experiment id.
+        :type experiment:   int
+        :return:            The timestamp, x and y float64 arrays, in
+                            timestamp order.
+        :rtype:             OrderedDict
+        """
+        self._read_guard()
+
+        length = int(self._execute(
+            "SELECT TOTAL(count) FROM samples WHERE experiment=?;",
+            [experiment]
+        ).fetchone()[0])
+        retval = OrderedDict(
+            (name, np.empty(length, dtype=np.float64))
+            for name in ("timestamp", "x", "y")
+        )
+
+        position = 0
+        cursor = self._execute(
+            "SELECT count, dtype, checksum, timestamp, x, y FROM samples "
+            "WHERE experiment=? ORDER BY chunk;", [experiment]
+        )
+        try:
+            for row in cursor:
+                count, dtype, crc = row[0], row[1], row[2]
+                blobs = (row[3], row[4], row[5])
+                if samples.checksum(*blobs) != crc \
+                        or position + count > length:
+                    raise RepositoryException(
+                        "Corrupted samples for experiment %s" % experiment
+                    )
+                for name, blob, blob_dtype in zip(
+                        retval.keys(), blobs,
+                        (samples.TIMESTAMP_DTYPE, dtype, dtype)):
+                    samples.decode(blob, blob_dtype, count,
+                                   retval[name][position:position + count])
+                position += count
+        finally:
+            cursor.close()
+        return retval
+
+    def convert_samples(self, experiments: list = None, dtype: str = None,
+                        delete: bool = False) -> int:
+        """
+        Copies experiments samples from the data table into the compact
+        samples table.
+
+        :param experiments: The experiments ids, default to every experiment
+                            having data rows.
+        :param dtype:       The coordinates storage dtype, see
+                            **write_samples**.
+        :param delete:      Whether to delete the converted data rows.
+        :type experiments:  list
+        :type dtype:        str
+        :type delete:       bool
+        :return:            The number of converted samples.
+        :rtype:             int
+        """
+        if experiments is None:
+            experiments = [row["experiment"] for row in self.aggregate(
+                {'count': "COUNT(*)"}, {}, "data", "experiment"
+            )]
+
+        converted = 0
+        for experiment in experiments:
+            pct.log("Converting experiment %s samples..." % experiment,
+                    Level.DEBUG, linesep="")
+            columns = self.read_columns(
+                {'experiment': experiment}, "data", ("timestamp", "x", "y")
+            )
+            self.write_samples(experiment, columns["timestamp"],
+                               columns["x"], columns["y"], dtype)
+            if delete:
+                self._execute("DELETE FROM data WHERE experiment=?;",
+                              [experiment])
+                if not self.long_transaction:
+                    self.db_conn.commit()
+            converted += len(columns["timestamp"])
+            pct.log(" Done", Level.DONE)
+        return converted
 
     def update(self, updates: dict, constraints: dict, table: str,
                precommit: bool = True) -> None:
@@ -306,28 +953,19 @@ class Repository(object):
         if precommit:
             self._read_guard()
 
-        query_constraints = ""
-        cpt = 0
-        for key in constraints:
-            if cpt > 0 and cpt < len(constraints):
-                query_constraints += " AND "
-            query_constraints += "{0}='{1}'".format(key, constraints[key])
-            cpt += 1
-
-        cpt = 0
-        query_updates = ""
-        for key in updates:
-            if cpt > 0 and cpt < len(updates):
-                query_updates += ", "
-            query_updates += "{0}='{1}'".format(key, updates[key])
-            cpt += 1
-
-        query = "UPDATE {0} SET {1} WHERE {2};".format(
-            table,
-            query_updates,
-            query_constraints
+        update_keys = tuple(updates.keys())
+        keys = self._shape(constraints)
+        query = self._statement(
+            ("update", table, update_keys, keys),
+            lambda: "UPDATE {0} SET {1}{2};".format(
+                table,
+                ", ".join("{0}=?".format(key) for key in update_keys),
+                self._where(keys)
+            )
+        )
+        self._execute(
+            query, list(updates.values()) + self._parameters(constraints)
         )
-        self.db_conn.execute(query)
 
         self._commit()
 
@@ -348,18 +986,14 @@ class Repository(object):
         """
         self._read_guard()
 
-        query = "SELECT COUNT( * ) AS count FROM {0}".format(table)
-        if constraints != {}:
-            query_constraints = " WHERE "
-            cpt = 0
-            for key in constraints:
-                if cpt > 0 and cpt < len(constraints):
-                    query_constraints += " AND "
-                query_constraints += "{0}='{1}'".format(key, constraints[key])
-                cpt += 1
-            query = query + query_constraints
-        query += ";"
-        cursor = self.db_conn.execute(query)
+        keys = self._shape(constraints)
+        query = self._statement(
+            ("count", table, keys),
+            lambda: "SELECT COUNT( * ) AS count FROM {0}{1};".format(
+                table, self._where(keys)
+            )
+        )
+        cursor = self._execute(query, self._parameters(constraints))
 
         return dict(cursor.fetchone())['count']
 
@@ -374,11 +1008,52 @@ class Repository(object):
         :return:        The number of records.
         :rtype:         int
         """
-        cursor = self.db_conn.execute(
-            "SELECT COUNT( * ) AS count FROM {0};".format(table)
+        return self.count({}, table)
+
+    def aggregate(self, expressions: dict, constraints: dict, table: str,
+                  group: str = None) -> list:
+        """
+        Computes the **expressions** SQL aggregates (e.g COUNT(*), MAX(id))
+        over the **table** records that meet the **constraints** constraints,
+        optionally grouped by the **group** column.
+
+        :param expressions: Alias / SQL aggregate expression dictionnary.
+        :param constraints: Key/value dictionnary used to filter the database
+                            selection. Set to empty {} to aggregate the whole
+                            table content.
+        :param table:       The table name.
+        :param group:       The grouping column, if any. Its value is returned
+                            under its own name.
+        :type expressions:  dict
+        :type constraints:  dict
+        :type table:        str
+        :type group:        str
+        :return:            A list of dictionnaries, one per group.
+        :rtype:             list
+        """
+        self._read_guard()
+
+        keys = self._shape(constraints)
+
+        def build() -> str:
+            query_expressions = ", ".join(
+                "{0} AS {1}".format(expression, alias)
+                for alias, expression in expressions.items()
+            )
+            if group is not None:
+                query_expressions = "{0}, {1}".format(group, query_expressions)
+            return "SELECT {0} FROM {1}{2}{3};".format(
+                query_expressions, table, self._where(keys),
+                "" if group is None else " GROUP BY {0}".format(group)
+            )
+
+        query = self._statement(
+            ("aggregate", table, tuple(expressions.items()), keys, group),
+            build
         )
+        cursor = self._execute(query, self._parameters(constraints))
 
-        return dict(cursor.fetchone())['count']
+        return [dict(cell) for cell in cursor.fetchall()]
 
     def _commit(self) -> None:
         """
@@ -410,4 +1085,55 @@ class Repository(object):
         self.db_conn.commit()
         self.long_transaction = False
 
+    def abort_transaction(self) -> None:
+        """
+        Rolls back every query issued since **start_transaction** and returns
+        to default Repository behaviour.
+        """
+        self.db_conn.rollback()
+        self._transaction_count = 0
+        self.long_transaction = False
+
 # ------------------------------------------------------------------ PROPERTIES
+
+    @property
+    def db_conn(self) -> sqlite3.Connection:
+        """
+        The calling thread connection, opened on first access.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+            self._local.connection = connection
+        return connection
+
+    @property
+    def long_transaction(self) -> bool:
+        """
+        Whether the calling thread started a long transaction, see
+        **start_transaction**.
+        """
+        return getattr(self._local, "long_transaction", False)
+
+    @long_transaction.setter
+    def long_transaction(self, value: bool) -> None:
+        self._local.long_transaction = value
+
+    @property
+    def _transaction_count(self) -> int:
+        """
+        The calling thread number of queries waiting for their delayed
+        commit.
+        """
+        return getattr(self._local, "transaction_count", 0)
+
+    @_transaction_count.setter
+    def _transaction_count(self, value: int) -> None:
+        self._local.transaction_count = value
+
+    @property
+    def version(self) -> int:
+        """
+        The last migration applied to the database, see **migrate**.
+        """
+        return self.db_conn.execute("PRAGMA user_version;").fetchone()[0]
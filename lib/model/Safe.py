@@ -39,9 +39,7 @@ class Safe(MutableSequence):
         cls = getattr(self, classname)
 
         if len(composition) < 2:
-            return [cls(cell["id"]) for cell in self._repository.read(
-                request, lazy=True
-            )]
+            return cls.from_records(self._repository.read(request))
 
         target = composition[0]
         source = composition[1]
@@ -55,9 +53,9 @@ class Safe(MutableSequence):
         except Exception as e:
             raise SafeException("Malformed composed request '%s'" % request)
 
-        return [cls(cell["id"]) for cell in self._repository.read(
-            request_filter, source, target, lazy=True
-        )]
+        return cls.from_records(self._repository.read(
+            request_filter, source, target
+        ))
 
     def __setitem__(self, key, value):
         pass
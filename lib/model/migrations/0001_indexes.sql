@@ -0,0 +1,12 @@
+-- Covers the per experiment samples reads: rows come out in timestamp order
+-- and id, timestamp, x, y are all read from the index.
+CREATE INDEX IF NOT EXISTS `data_experiment_timestamp`
+    ON `data` ( `experiment`, `timestamp`, `x`, `y` );
+
+-- Covers the subject experiments lookups, by subject or subject and name.
+CREATE INDEX IF NOT EXISTS `experiments_subject_name`
+    ON `experiments` ( `subject`, `name` );
+
+-- The experiments_aois primary key already covers experiment lookups.
+CREATE INDEX IF NOT EXISTS `experiments_aois_aoi`
+    ON `experiments_aois` ( `aoi` );
@@ -0,0 +1,14 @@
+-- Compact gaze samples layout: each experiment samples are stored as
+-- fixed-size chunks of compressed little endian arrays, see samples.py.
+CREATE TABLE IF NOT EXISTS `samples` (
+    `experiment`    INTEGER             NOT NULL,
+    `chunk`         INTEGER             NOT NULL,
+    `count`         INTEGER             NOT NULL,
+    `dtype`         VARCHAR             NOT NULL,
+    `checksum`      INTEGER             NOT NULL,
+    `timestamp`     BLOB                NOT NULL,
+    `x`             BLOB                NOT NULL,
+    `y`             BLOB                NOT NULL,
+    CONSTRAINT PK_samples PRIMARY KEY ( experiment, chunk ),
+    FOREIGN KEY ( experiment ) REFERENCES experiments ( id )
+) WITHOUT ROWID;
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Part of the **Pyception** package.
+
+:Version: 1
+:Authors: - Florian Indot
+:Contact: florian.indot@gmail.com
+:Date: 17.10.2026
+:Revision: 1
+:Copyright: MIT License
+
+Gaze samples BLOB codec. A column chunk is stored as its little endian bytes,
+shuffled (every value first byte, then every second byte...) and deflated:
+shuffling groups the slowly varying exponent and high mantissa bytes, which
+compress far better than interleaved values.
+"""
+
+import zlib
+
+import numpy as np
+
+TIMESTAMP_DTYPE = "<f8"
+
+
+def encode(values: np.ndarray, dtype: str, level: int = 1) -> bytes:
+    """
+    Encodes **values** as a compressed **dtype** array.
+
+    :param values:  The column values.
+    :param dtype:   The little endian storage dtype, e.g <f8 or <f4.
+    :param level:   The zlib compression level.
+    :type values:   np.ndarray
+    :type dtype:    str
+    :type level:    int
+    :return:        The encoded bytes.
+    :rtype:         bytes
+    """
+    values = np.ascontiguousarray(values, dtype=dtype)
+    shuffled = values.view(np.uint8).reshape(-1, values.itemsize).T
+    return zlib.compress(shuffled.tobytes(), level)
+
+
+def decode(blob: bytes, dtype: str, count: int,
+           out: np.ndarray = None) -> np.ndarray:
+    """
+    Decodes an **encode** blob.
+
+    :param blob:    The encoded bytes.
+    :param dtype:   The storage dtype.
+    :param count:   The number of values.
+    :param out:     The array receiving the values, if any.
+    :type blob:     bytes
+    :type dtype:    str
+    :type count:    int
+    :type out:      np.ndarray
+    :return:        The values, **out** if given.
+    :rtype:         np.ndarray
+    """
+    dtype = np.dtype(dtype)
+    shuffled = np.frombuffer(zlib.decompress(blob), dtype=np.uint8)
+    values = shuffled.reshape(dtype.itemsize, count).T.copy().view(dtype)
+    values = values.reshape(count)
+    if out is None:
+        return values.astype(dtype.newbyteorder("="))
+    out[:] = values
+    return out
+
+
+def checksum(*blobs) -> int:
+    """
+    CRC32 of the encoded chunk blobs, stored along with them.
+    """
+    crc = 0
+    for blob in blobs:
+        crc = zlib.crc32(blob, crc)
+    return crc
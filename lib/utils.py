@@ -19,3 +19,28 @@ def inheritdoc(cls):
             cls.__doc__ = base.__doc__
             break
     return cls
+
+
+class lazy_attribute(object):
+    """
+    Class attribute decorator. The decorated function, given the class, is
+    only called on the attribute first access and its result then replaces
+    the attribute on the class. Costly class level values (e.g connections,
+    kernels) are thus not built at import time::
+
+        class Experiment(object):
+            @lazy_attribute
+            def repository(cls):
+                return Repository(SETTINGS["db_file"])
+
+    Assigning the attribute on the class beforehand skips the function.
+    """
+    def __init__(self, function: callable) -> None:
+        self.function = function
+        self.name = function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner):
+        value = self.function(owner)
+        setattr(owner, self.name, value)
+        return value
@@ -32,3 +32,69 @@ db_file = os.path.join(workdir, "data.db")  # Might change
 #   DEBUG
 #   TRACE
 logging_level = Level.INFORMATION
+# Heatmap convolution backend, default to "fft"
+# Can be set to :
+#   direct      reference spatial convolution, very slow
+#   fft         frequency domain convolution
+#   separable   1D convolutions, fast with gaussian kernels only, other
+#               kernels falling back to fft
+#   splat       kernel stamped around each fixation, clipped at the edges
+heatmap_backend = "fft"
+# Whether to save the heatmap kernels in the working directory, sparing their
+# construction on later runs
+persist_kernels = False
+# Whether to cache analysis results (fixations, heatmaps) in the working
+# directory, and the cache size limit in bytes
+result_cache = True
+result_cache_size = 2 * 1024 ** 3
+# Analysis results export format, default to "xlsx"
+# Can be set to :
+#   xlsx        single Excel workbook, one sheet per table
+#   csv         one streamed CSV file per table
+#   parquet     one Parquet file per table, requires pyarrow
+#   feather     one Feather file per table, requires pyarrow
+#   npz         single numpy archive, one array per column
+export_format = "xlsx"
+# Number of background threads writing analysis outputs, and the maximum
+# number of outputs waiting to be written before analysis blocks
+writer_threads = 2
+writer_queue_size = 4
+# Maximum time, in seconds, "import lib" may take, checked by --benchmark
+import_time_budget = 1.0
+# SQLite connection profiles, the PRAGMA name / value pairs applied to every
+# database connection, and the profile used by default
+#   analysis        read heavy: large page cache and memory mapped reads
+#   bulk_import     write heavy: no fsync, the database may be lost on crash
+# The journal mode is stored in the database file: only the writer profile
+# switches it to WAL, so that readers and one writer run concurrently
+db_profiles = {
+    'analysis': {
+        'synchronous': "NORMAL",
+        'cache_size': -256 * 1024,
+        'mmap_size': 1024 ** 3,
+        'temp_store': "MEMORY",
+        'busy_timeout': 10000
+    },
+    'bulk_import': {
+        'journal_mode': "WAL",
+        'synchronous': "OFF",
+        'cache_size': -512 * 1024,
+        'mmap_size': 1024 ** 3,
+        'temp_store': "MEMORY",
+        'busy_timeout': 10000
+    }
+}
+db_profile = "analysis"
+# Gaze samples storage layout read by analysis, default to "rows"
+# Can be set to :
+#   rows        one data table row per sample
+#   blob        compressed chunks of samples, see the --convert option
+# and the coordinates storage type of the blob layout, "<f8" (float64) or the
+# lossy but twice smaller "<f4" (float32)
+sample_storage = "rows"
+sample_dtype = "<f8"
+# Whether analysis reads samples from memory-mapped copies kept in the working
+# directory, written on first read and kept up to date by the --sync option
+sample_store = False
+# Number of Tobii gaze export rows read at once by the --import option
+import_chunk_size = 100000